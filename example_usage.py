@@ -4,157 +4,198 @@ Example Usage Scripts for Projector Control
 Demonstrates common operations and workflows
 """
 
+from contextlib import nullcontext
 from projector_control import ProjectorController
+import asyncio
+import sys
 import time
 
+SEP = "=" * 60
 
-def example_quick_status():
-    """Example: Quick status check"""
-    print("=" * 60)
-    print("EXAMPLE 1: Quick Status Check")
-    print("=" * 60)
+BANNER = "\n".join([
+    "\n╔" + "=" * 58 + "╗",
+    "║  PROJECTOR CONTROL - EXAMPLE USAGE DEMONSTRATIONS       ║",
+    "╚" + "=" * 58 + "╝",
+])
+
+
+def _session(proj=None):
+    """Reuse an open controller if given, otherwise open a new connection"""
+    return nullcontext(proj) if proj is not None else ProjectorController(port='COM10')
+
+
+def _fmt_fan(name, rpm):
+    """Format one fan-speed line, flagging fans below 1000 RPM"""
+    if rpm is None:
+        return f"  {name}: Unknown"
+    return f"  {name}: {rpm} RPM {'⚠️ LOW!' if rpm < 1000 else '✓'}"
 
-    with ProjectorController(port='COM10') as proj:
-        # Get basic info
-        power = proj.get_power_state()
-        source = proj.get_input_source()
-        mode = proj.get_display_mode()
-        volume = proj.get_volume()
 
-        print(f"\nPower: {'ON' if power else 'OFF'}")
-        print(f"Source: {source}")
-        print(f"Display Mode: {mode}")
-        print(f"Volume: {volume}/10")
+def wait_until(predicate, timeout=45, initial=0.5, max_interval=2.0):
+    """
+    Poll predicate with exponential backoff until it returns a truthy value
 
-        # Get system health
-        temp = proj.get_temperature()
-        hours = proj.get_lamp_hours()
+    Args:
+        predicate: Zero-argument callable to poll
+        timeout: Give up after this many seconds
+        initial: First sleep interval in seconds (doubled each tick)
+        max_interval: Upper bound for the sleep interval
 
-        print(f"\nTemperature: {temp}°C")
-        print(f"Runtime: {hours} hours")
+    Returns:
+        The predicate's truthy result, or False on timeout
+    """
+    deadline = time.monotonic() + timeout
+    interval = initial
+    while time.monotonic() < deadline:
+        time.sleep(min(interval, max(0, deadline - time.monotonic())))
+        result = predicate()
+        if result:
+            return result
+        interval = min(interval * 2, max_interval)
+    return False
 
 
-def example_presentation_setup():
+def example_quick_status(proj=None):
+    """Example: Quick status check"""
+    print(SEP)
+    print("EXAMPLE 1: Quick Status Check")
+    print(SEP)
+
+    with _session(proj) as proj:
+        status = proj.get_all_status()
+
+    lines = [
+        f"\nPower: {'ON' if status['power'] else 'OFF'}",
+        f"Source: {status['input_source']}",
+        f"Display Mode: {status['display_mode']}",
+        f"Volume: {status['volume']}/10",
+        f"\nTemperature: {status['temperature']}°C",
+        f"Runtime: {status['lamp_hours']} hours",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def example_presentation_setup(proj=None):
     """Example: Automated presentation setup"""
-    print("\n" + "=" * 60)
+    print("\n" + SEP)
     print("EXAMPLE 2: Presentation Setup")
-    print("=" * 60)
+    print(SEP)
 
-    with ProjectorController(port='COM10') as proj:
+    with _session(proj) as proj:
         print("\nConfiguring projector for presentation...")
 
         # Check if already on
         if not proj.get_power_state():
             print("  - Powering on projector...")
             proj.power_on()
-            print("  - Waiting for warmup (30 seconds)...")
-            time.sleep(30)
+            print("  - Waiting for warmup...")
+            if not wait_until(proj.get_power_state, timeout=45):
+                print("  - Projector did not report ON within 45 seconds")
         else:
             print("  - Already powered on")
 
-        # Configure settings
-        print("  - Setting source to HDMI...")
-        proj.set_source_hdmi()
-
-        print("  - Setting display mode to Presentation...")
-        proj.set_display_mode_presentation()
-
-        print("  - Setting aspect ratio to 16:9...")
-        proj.set_aspect_16_9()
-
-        print("  - Setting brightness to 8...")
-        proj.set_brightness(8)
-
-        print("  - Setting contrast to 5...")
-        proj.set_contrast(5)
+        # Configure settings in a single write
+        print("  - Applying HDMI source, Presentation mode, 16:9, brightness 8, contrast 5...")
+        results = proj.apply_settings(source='hdmi', display_mode='presentation',
+                                      aspect='16:9', brightness=8, contrast=5)
+        for setting, ok in results.items():
+            if not ok:
+                print(f"  ✗ Failed to set {setting}")
 
         print("\n✓ Presentation setup complete!")
 
 
-def example_movie_mode():
+def example_movie_mode(proj=None):
     """Example: Switch to cinema/movie mode"""
-    print("\n" + "=" * 60)
+    print("\n" + SEP)
     print("EXAMPLE 3: Movie Mode Setup")
-    print("=" * 60)
+    print(SEP)
 
-    with ProjectorController(port='COM10') as proj:
+    with _session(proj) as proj:
         print("\nConfiguring projector for movie viewing...")
 
-        print("  - Setting display mode to Cinema...")
-        proj.set_display_mode_cinema()
+        # Configure settings in a single write
+        print("  - Applying Cinema mode, Warm color temperature, Auto aspect, brightness 5, contrast 6...")
+        results = proj.apply_settings(display_mode='cinema', color_temp='warm',
+                                      aspect='auto', brightness=5, contrast=6)
+        for setting, ok in results.items():
+            if not ok:
+                print(f"  ✗ Failed to set {setting}")
 
-        print("  - Setting color temperature to Warm...")
-        proj.set_color_temp_warm()
-
-        print("  - Setting aspect ratio to Auto...")
-        proj.set_aspect_auto()
+        print("\n✓ Movie mode configured!")
 
-        print("  - Setting brightness to 5...")
-        proj.set_brightness(5)
 
-        print("  - Setting contrast to 6...")
-        proj.set_contrast(6)
+async def _read_health(port):
+    """Issue all health queries concurrently over one pipelined connection"""
+    # Imported here so the other examples run without pyserial-asyncio
+    from projector_async import AsyncProjectorController
 
-        print("\n✓ Movie mode configured!")
+    async with AsyncProjectorController(port=port) as proj:
+        return await asyncio.gather(
+            proj.get_temperature(),
+            proj.get_fan_speeds(),
+            proj.get_lamp_hours(),
+            proj.get_system_hours(),
+            proj.get_signal_status(),
+            proj.get_resolution(),
+            proj.get_refresh_rate(),
+        )
 
 
-def example_health_monitoring():
+def example_health_monitoring(proj=None):
     """Example: System health check"""
-    print("\n" + "=" * 60)
+    print("\n" + SEP)
     print("EXAMPLE 4: System Health Monitoring")
-    print("=" * 60)
-
-    with ProjectorController(port='COM10') as proj:
-        print("\nChecking projector health...\n")
-
-        # Temperature check
-        temp = proj.get_temperature()
-        if temp:
-            print(f"Temperature: {temp}°C", end="")
-            if temp > 70:
-                print(" ⚠️ HIGH!")
-            elif temp > 60:
-                print(" (warm)")
-            else:
-                print(" (normal)")
-
-        # Fan speeds
-        fans = proj.get_fan_speeds()
-        print("\nFan Speeds:")
-        for fan_name, rpm in fans.items():
-            if rpm:
-                status = "⚠️ LOW!" if rpm < 1000 else "✓"
-                print(f"  {fan_name}: {rpm} RPM {status}")
-            else:
-                print(f"  {fan_name}: Unknown")
+    print(SEP)
+
+    print("\nChecking projector health...\n")
+
+    # The asyncio controller needs the port to itself while it runs
+    port = proj.port if proj is not None else 'COM10'
+    if proj is not None:
+        proj.disconnect()
+    try:
+        temp, fans, lamp_hours, system_hours, signal, resolution, refresh = \
+            asyncio.run(_read_health(port))
+    finally:
+        if proj is not None:
+            proj.connect()
+
+    # Temperature check
+    if temp:
+        print(f"Temperature: {temp}°C", end="")
+        if temp > 70:
+            print(" ⚠️ HIGH!")
+        elif temp > 60:
+            print(" (warm)")
+        else:
+            print(" (normal)")
 
-        # Usage hours
-        lamp_hours = proj.get_lamp_hours()
-        system_hours = proj.get_system_hours()
-        print(f"\nUsage Statistics:")
-        print(f"  Lamp Hours: {lamp_hours}")
-        print(f"  System Hours: {system_hours}")
+    # Fan speeds
+    print("\nFan Speeds:")
+    print("\n".join(_fmt_fan(name, rpm) for name, rpm in fans.items()))
 
-        # Signal status
-        signal = proj.get_signal_status()
-        resolution = proj.get_resolution()
-        refresh = proj.get_refresh_rate()
+    # Usage hours
+    print(f"\nUsage Statistics:")
+    print(f"  Lamp Hours: {lamp_hours}")
+    print(f"  System Hours: {system_hours}")
 
-        print(f"\nSignal Status:")
-        print(f"  Active: {'Yes ✓' if signal else 'No ✗' if signal is False else 'Unknown'}")
-        if resolution:
-            print(f"  Resolution: {resolution}")
-        if refresh:
-            print(f"  Refresh Rate: {refresh}")
+    # Signal status
+    print(f"\nSignal Status:")
+    print(f"  Active: {'Yes ✓' if signal else 'No ✗' if signal is False else 'Unknown'}")
+    if resolution:
+        print(f"  Resolution: {resolution}")
+    if refresh:
+        print(f"  Refresh Rate: {refresh}")
 
 
-def example_power_cycle():
+def example_power_cycle(proj=None):
     """Example: Safe power cycle"""
-    print("\n" + "=" * 60)
+    print("\n" + SEP)
     print("EXAMPLE 5: Power Cycle")
-    print("=" * 60)
+    print(SEP)
 
-    with ProjectorController(port='COM10') as proj:
+    with _session(proj) as proj:
         # Check current state
         is_on = proj.get_power_state()
         print(f"\nCurrent power state: {'ON' if is_on else 'OFF'}")
@@ -171,13 +212,13 @@ def example_power_cycle():
                 print("  (Projector will warm up for ~30 seconds)")
 
 
-def example_source_cycling():
+def example_source_cycling(proj=None):
     """Example: Cycle through sources"""
-    print("\n" + "=" * 60)
+    print("\n" + SEP)
     print("EXAMPLE 6: Source Testing")
-    print("=" * 60)
+    print(SEP)
 
-    with ProjectorController(port='COM10') as proj:
+    with _session(proj) as proj:
         sources = [
             ("HDMI", proj.set_source_hdmi),
             ("USB-A", proj.set_source_usb),
@@ -190,11 +231,9 @@ def example_source_cycling():
             print(f"Switching to {source_name}...", end=" ")
             if set_func():
                 print("✓")
-                time.sleep(2)  # Give time to switch
 
-                # Check signal
-                signal = proj.get_signal_status()
-                if signal:
+                # Wait only as long as the new input takes to lock
+                if proj.wait_for_signal():
                     res = proj.get_resolution()
                     print(f"  Signal detected: {res if res else 'Unknown resolution'}")
                 else:
@@ -203,107 +242,112 @@ def example_source_cycling():
                 print("✗ Failed")
 
 
-def example_comprehensive_info():
+def example_comprehensive_info(proj=None):
     """Example: Get all available information"""
-    print("\n" + "=" * 60)
+    print("\n" + SEP)
     print("EXAMPLE 7: Comprehensive Information Dump")
-    print("=" * 60)
+    print(SEP)
 
-    with ProjectorController(port='COM10') as proj:
+    with _session(proj) as proj:
         print("\nRetrieving all projector information...\n")
 
-        # System info
-        info = proj.get_system_info()
-        print("=== SYSTEM INFO ===")
-        for key, val in info.items():
-            print(f"  {key}: {val}")
-
-        # Software versions
-        versions = proj.get_software_version()
-        print("\n=== SOFTWARE VERSIONS ===")
-        for key, val in versions.items():
-            print(f"  {key}: {val}")
-
-        # Network
-        print("\n=== NETWORK ===")
-        print(f"  MAC Address: {proj.get_mac_address()}")
-        print(f"  WiFi Status: {proj.get_network_status()}")
-        print(f"  Device ID: {proj.get_device_id()}")
-
-        # Display settings
-        print("\n=== DISPLAY SETTINGS ===")
-        print(f"  Display Mode: {proj.get_display_mode()}")
-        print(f"  Projection Mode: {proj.get_projection_mode()}")
-        print(f"  Aspect Ratio: {proj.get_aspect_ratio()}")
-        print(f"  Brightness: {proj.get_brightness()}")
-        print(f"  Contrast: {proj.get_contrast()}")
-        print(f"  Color Temperature: {proj.get_color_temperature()}")
-
-        # Audio
-        print("\n=== AUDIO ===")
-        print(f"  Volume: {proj.get_volume()}")
-        print(f"  Audio Mute: {proj.get_audio_mute_state()}")
-        print(f"  AV Mute: {proj.get_av_mute_state()}")
-
-        # Hardware status
-        print("\n=== HARDWARE STATUS ===")
-        print(f"  Temperature: {proj.get_temperature()}°C")
-
-        fans = proj.get_fan_speeds()
-        for fan_name, rpm in fans.items():
-            print(f"  {fan_name}: {rpm} RPM" if rpm else f"  {fan_name}: Unknown")
-
-
-def main():
-    """Run all examples"""
-    print("\n" + "╔" + "=" * 58 + "╗")
-    print("║  PROJECTOR CONTROL - EXAMPLE USAGE DEMONSTRATIONS       ║")
-    print("╚" + "=" * 58 + "╝")
-
-    examples = [
-        ("Quick Status Check", example_quick_status),
-        ("Presentation Setup", example_presentation_setup),
-        ("Movie Mode Setup", example_movie_mode),
-        ("Health Monitoring", example_health_monitoring),
-        ("Power Cycle", example_power_cycle),
-        ("Source Testing", example_source_cycling),
-        ("Comprehensive Info", example_comprehensive_info),
+        # Fetch everything in a single round-trip
+        status = proj.get_all_status()
+
+    lines = ["=== SYSTEM INFO ==="]
+    lines += [f"  {key}: {val}" for key, val in status['system_info'].items()]
+
+    lines.append("\n=== SOFTWARE VERSIONS ===")
+    lines += [f"  {key}: {val}" for key, val in status['software_version'].items()]
+
+    lines += [
+        "\n=== NETWORK ===",
+        f"  MAC Address: {status['mac_address']}",
+        f"  WiFi Status: {status['network_status']}",
+        f"  Device ID: {status['device_id']}",
+
+        "\n=== DISPLAY SETTINGS ===",
+        f"  Display Mode: {status['display_mode']}",
+        f"  Projection Mode: {status['projection_mode']}",
+        f"  Aspect Ratio: {status['aspect_ratio']}",
+        f"  Brightness: {status['brightness']}",
+        f"  Contrast: {status['contrast']}",
+        f"  Color Temperature: {status['color_temperature']}",
+
+        "\n=== AUDIO ===",
+        f"  Volume: {status['volume']}",
+        f"  Audio Mute: {status['audio_mute']}",
+        f"  AV Mute: {status['av_mute']}",
+
+        "\n=== HARDWARE STATUS ===",
+        f"  Temperature: {status['temperature']}°C",
     ]
+    lines += [_fmt_fan(name, rpm) for name, rpm in status['fans'].items()]
 
-    print("\nAvailable Examples:")
-    for i, (name, _) in enumerate(examples, 1):
-        print(f"  [{i}] {name}")
-    print(f"  [A] Run All")
-    print(f"  [Q] Quit")
+    # Emit the whole report in one write
+    sys.stdout.write("\n".join(lines) + "\n")
 
-    choice = input("\nSelect example to run: ").strip().upper()
 
-    if choice == 'Q':
-        return
+# Menu key -> (name, example function)
+EXAMPLES = {
+    '1': ("Quick Status Check", example_quick_status),
+    '2': ("Presentation Setup", example_presentation_setup),
+    '3': ("Movie Mode Setup", example_movie_mode),
+    '4': ("Health Monitoring", example_health_monitoring),
+    '5': ("Power Cycle", example_power_cycle),
+    '6': ("Source Testing", example_source_cycling),
+    '7': ("Comprehensive Info", example_comprehensive_info),
+}
 
-    if choice == 'A':
-        for name, func in examples:
+MENU_TEXT = "\n".join(
+    ["\nAvailable Examples:"]
+    + [f"  [{key}] {name}" for key, (name, _) in EXAMPLES.items()]
+    + ["  [A] Run All", "  [Q] Quit"]
+)
+
+
+def run_all():
+    """Run every example over one shared connection"""
+    with ProjectorController(port='COM10') as proj:
+        for name, func in EXAMPLES.values():
             try:
-                func()
-                time.sleep(1)
+                func(proj)
             except Exception as e:
                 print(f"\n✗ Error in {name}: {e}")
-    else:
+
+
+def main(choice=None):
+    """
+    Run the example picked from the menu
+
+    Args:
+        choice: Menu key ('1'-'7', 'A' or 'Q'); prompts when None
+    """
+    print(BANNER)
+
+    if choice is None:
+        print(MENU_TEXT)
+        choice = input("\nSelect example to run: ")
+    choice = choice.strip().upper()
+
+    if choice == 'Q':
+        return
+
+    if choice == 'A':
+        run_all()
+    elif choice in EXAMPLES:
         try:
-            idx = int(choice) - 1
-            if 0 <= idx < len(examples):
-                examples[idx][1]()
-            else:
-                print("Invalid choice")
-        except ValueError:
-            print("Invalid choice")
+            EXAMPLES[choice][1]()
         except Exception as e:
             print(f"\n✗ Error: {e}")
+    else:
+        print("Invalid choice")
 
-    print("\n" + "=" * 60)
+    print("\n" + SEP)
     print("Example complete!")
-    print("=" * 60)
+    print(SEP)
 
 
 if __name__ == "__main__":
-    main()
+    # Optional menu key, e.g. `python example_usage.py 3`
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+Asyncio Projector Control Interface
+Pipelines RS232 queries over a pyserial-asyncio transport
+"""
+
+import asyncio
+import collections
+import functools
+import time
+from typing import Any, Dict, List, Optional
+
+import serial_asyncio
+
+from projector_control import ProjectorController, encode_frame, is_reply, parse_bool, parse_int, parse_text
+
+
+class _CommandRecorder(ProjectorController):
+    """
+    Runs ProjectorController methods without a serial port
+
+    With replies unset, every command a method would send is recorded and
+    answered with '' (batched commands with a bare 'Ok', so re-queries for
+    missing replies are not recorded). With replies set, they are handed
+    back in order, so a second run of the same method parses the real
+    responses. Both runs must send the same commands, so getters never
+    answer from the @_cached values.
+    """
+
+    def __init__(self, device_id='00'):
+        super().__init__(port=None, device_id=device_id, low_latency=False)
+        self.sent = []
+        self.replies = None
+
+    def _send_command(self, command: str) -> str:
+        if self.replies is None:
+            self.sent.append(command)
+            return ''
+        return self.replies.popleft() if self.replies else ''
+
+    def send_batch(self, commands: List[str]) -> List[str]:
+        if self.replies is None:
+            self.sent.extend(commands)
+            return ['Ok'] * len(commands)
+        return [self._send_command(command) for command in commands]
+
+    def _is_cached(self, getter: str) -> bool:
+        return False
+
+
+# Sync methods that manage the connection or batching and have no async twin
+_SYNC_ONLY = frozenset([
+    'connect', 'disconnect', 'set_low_latency', 'batch_cache', 'send_batch', 'begin_batch',
+    'pending_commands', 'commit_batch', 'discard_batch', 'batch_query', 'get_status_bundle',
+    'get_all_status', 'wait_for_signal', 'start_status_polling', 'stop_status_polling',
+])
+
+
+def _delegate(name: str):
+    """Build an async method that runs ProjectorController.<name> over the async transport"""
+    @functools.wraps(getattr(ProjectorController, name))
+    async def method(self, *args, **kwargs):
+        return await self._run(name, *args, **kwargs)
+    return method
+
+
+class AsyncProjectorController:
+    """
+    Asyncio control interface for DDP projector via RS232
+
+    Commands are queued and written by a single writer task; a reader task
+    hands each CR-terminated reply to the oldest pending request. The
+    protocol answers strictly in order, so concurrent getters (e.g. via
+    asyncio.gather) are pipelined on the wire without losing correlation.
+
+    Every ProjectorController command method (power_on, set_brightness,
+    get_input_source, ...) is available as a coroutine with the same
+    arguments and return value.
+    """
+
+    def __init__(self, port='COM10', baudrate=9600, device_id='00', timeout=2.0):
+        """
+        Initialize async projector controller
+
+        Args:
+            port: Serial port name (e.g., 'COM10')
+            baudrate: Baud rate (default 9600)
+            device_id: Projector device ID (00-99, default '00' for broadcast)
+            timeout: Seconds to wait for each response
+        """
+        self.port = port
+        self.baudrate = baudrate
+        self.device_id = device_id
+        self.timeout = timeout
+        self._reader = None
+        self._writer = None
+        self._queue = None
+        self._pending = collections.deque()
+        self._tasks = []
+        self._resync_at = None  # loop time of a lost reply; writes wait for the line to go quiet
+        self._resync_quiet = min(0.5, timeout / 4)  # silence that ends the wait, leaving time to reply
+        self._last_rx = 0.0
+        self._recorder = _CommandRecorder(device_id)
+
+    async def connect(self) -> bool:
+        """Open serial connection and start the reader/writer tasks"""
+        if self._writer is not None:
+            return True
+
+        try:
+            self._reader, self._writer = await serial_asyncio.open_serial_connection(
+                url=self.port, baudrate=self.baudrate)
+        except Exception as e:
+            print(f"Connection error: {e}")
+            return False
+
+        self._queue = asyncio.Queue()
+        self._tasks = [asyncio.create_task(self._write_loop()),
+                       asyncio.create_task(self._read_loop())]
+        return True
+
+    async def disconnect(self):
+        """Stop the reader/writer tasks and close the serial connection"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            self._reader = None
+
+        while self._pending:
+            future = self._pending.popleft()
+            if not future.done():
+                future.set_result('')
+
+    async def _write_loop(self):
+        """Write queued commands in order, registering each as pending"""
+        while True:
+            command, future = await self._queue.get()
+            if self._resync_at is not None:
+                await self._wait_quiet()
+            if future.done():
+                continue  # timed out while queued; never sent
+            self._pending.append(future)
+            self._writer.write(encode_frame(self.device_id, command))
+            await self._writer.drain()
+
+    async def _read_loop(self):
+        """Resolve the oldest pending request with each reply"""
+        while True:
+            line = (await self._reader.readuntil(b'\r')).decode('ascii', errors='ignore').strip()
+            self._last_rx = asyncio.get_running_loop().time()
+            if not self._pending or not is_reply(line):
+                continue  # unsolicited data, or a late reply after a resync
+            future = self._pending.popleft()
+            if not future.done():
+                future.set_result(line)
+
+    def _abandon_pending(self):
+        """
+        Give up on every in-flight request after a reply was lost
+
+        Replies carry no tags, so once one is missing the rest can no longer be
+        matched by position. Each in-flight request resolves to '' and new
+        writes wait until the line has been quiet for _resync_quiet seconds,
+        so any late replies are discarded rather than handed to them.
+        """
+        while self._pending:
+            future = self._pending.popleft()
+            if not future.done():
+                future.set_result('')
+        self._resync_at = asyncio.get_running_loop().time()
+
+    async def _wait_quiet(self):
+        """Hold writes until nothing has been received for _resync_quiet seconds"""
+        loop = asyncio.get_running_loop()
+        while True:
+            idle = loop.time() - max(self._last_rx, self._resync_at)
+            if idle >= self._resync_quiet:
+                break
+            await asyncio.sleep(self._resync_quiet - idle)
+        self._resync_at = None
+
+    async def _send_command(self, command: str) -> str:
+        """
+        Queue command and wait for its response
+
+        Args:
+            command: Command string without CR terminator
+
+        Returns:
+            Response string from projector ('' on timeout)
+        """
+        if self._writer is None and not await self.connect():
+            return ""
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((command, future))
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), self.timeout)
+        except asyncio.TimeoutError:
+            if future in self._pending:
+                self._abandon_pending()
+            future.cancel()
+            return ""
+
+    async def _run(self, name: str, *args, **kwargs) -> Any:
+        """
+        Run a ProjectorController method with its commands sent asynchronously
+
+        The method is run once to record the commands it sends, the commands
+        are pipelined, then it is run again over the replies to parse them.
+
+        Args:
+            name: ProjectorController method name (e.g. 'get_volume')
+
+        Returns:
+            Whatever the synchronous method returns
+        """
+        recorder = self._recorder
+        recorder.replies = None
+        recorder.sent = []
+        getattr(recorder, name)(*args, **kwargs)
+        commands = recorder.sent
+
+        replies = await asyncio.gather(*(self._send_command(command) for command in commands))
+
+        recorder.replies = collections.deque(replies)
+        try:
+            return getattr(recorder, name)(*args, **kwargs)
+        finally:
+            recorder.replies = None
+
+    async def get_status_bundle(self, fields=('power', 'input_source', 'display_mode', 'volume',
+                                              'temperature', 'lamp_hours')) -> Dict[str, Any]:
+        """
+        Read a bundle of status values with all queries pipelined
+
+        Args:
+            fields: Query names from ProjectorController.BATCH_QUERIES
+
+        Returns:
+            Dictionary keyed by query name
+        """
+        fields = list(fields)
+        values = await asyncio.gather(
+            *(self._run(ProjectorController.BATCH_QUERIES[name][0]) for name in fields))
+        return dict(zip(fields, values))
+
+    async def get_all_status(self) -> Dict[str, Any]:
+        """Read every status value with all queries pipelined"""
+        return await self.get_status_bundle(ProjectorController.BATCH_QUERIES)
+
+    async def wait_for_signal(self, timeout: float = 2.5, interval: float = 0.1) -> bool:
+        """
+        Poll signal status until the current input reports an active signal
+
+        Args:
+            timeout: Seconds to keep polling
+            interval: Seconds between polls
+
+        Returns:
+            True as soon as a signal is detected, False on timeout
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            if await self.get_signal_status():
+                return True
+            if time.monotonic() + interval >= deadline:
+                return False
+            await asyncio.sleep(interval)
+
+    # ========== SYSTEM INFORMATION ==========
+
+    async def get_lamp_hours(self) -> Optional[int]:
+        """Get light source hours of usage"""
+        return parse_int(await self._send_command('108 1'))
+
+    async def get_system_hours(self) -> Optional[int]:
+        """Get total system hours of usage"""
+        return parse_int(await self._send_command('150 21'))
+
+    async def get_temperature(self) -> Optional[int]:
+        """Get system temperature"""
+        return parse_int(await self._send_command('352 1'))
+
+    async def get_fan_speeds(self) -> Dict[str, Optional[int]]:
+        """Get all fan speeds in RPM (queries are pipelined)"""
+        responses = await asyncio.gather(
+            *(self._send_command(f'351 {fan_num}') for fan_num, _ in ProjectorController.FANS))
+        return {fan_name: parse_int(response)
+                for (_, fan_name), response in zip(ProjectorController.FANS, responses)}
+
+    async def get_signal_status(self) -> Optional[bool]:
+        """Get signal status of current input. Returns True if signal active"""
+        return parse_bool(await self._send_command('150 23'))
+
+    async def get_resolution(self) -> Optional[str]:
+        """Get source resolution"""
+        return parse_text(await self._send_command('150 4'))
+
+    async def get_refresh_rate(self) -> Optional[str]:
+        """Get refresh rate"""
+        return parse_text(await self._send_command('150 19'))
+
+    # ========== CONTEXT MANAGER SUPPORT ==========
+
+    async def __aenter__(self):
+        """Async context manager entry"""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.disconnect()
+
+
+for _name in vars(ProjectorController):
+    if (callable(getattr(ProjectorController, _name)) and not _name.startswith('_')
+            and _name not in _SYNC_ONLY and _name not in vars(AsyncProjectorController)):
+        setattr(AsyncProjectorController, _name, _delegate(_name))
+del _name
@@ -3,10 +3,307 @@
 Interactive CLI Interface for Projector Control
 """
 
+import atexit
+import select
+import signal
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import cached_property
+from itertools import islice
 from pathlib import Path
 from projector_control import ProjectorController
-from projector_config import ProjectorConfig
+from projector_config import ProjectorConfig, format_result
+
+try:
+    import msvcrt  # Windows console
+except ImportError:
+    msvcrt = None
+
+# Status glyphs, with ASCII fallbacks for consoles that can't encode them
+if sys.stdout.encoding and 'utf' in sys.stdout.encoding.lower():
+    _OK, _FAIL, _SKIP = '✓', '✗', '⊝'
+else:
+    _OK, _FAIL, _SKIP = '[OK]', '[!!]', '[--]'
+
+
+# Static menu text, built once at import
+_HEADER_STR = "\n".join([
+    "\n" + "=" * 70,
+    "  PROJECTOR CONTROL INTERFACE",
+    "=" * 70,
+]) + "\n"
+
+_MAIN_MENU_STR = "\n".join([
+    "\n" + "-" * 70,
+    "MAIN MENU",
+    "-" * 70,
+    "  [1] Power Control          [2] Source Control",
+    "  [3] Display Settings       [4] Image Settings",
+    "  [5] Audio Control          [6] Remote Functions",
+    "  [7] System Information     [8] Advanced Settings",
+    "  [9] Quick Status           [C] Config Save/Load",
+    "  [0] Exit",
+    "-" * 70,
+]) + "\n"
+
+_POWER_MENU_STR = "\n".join([
+    "\n--- POWER CONTROL ---",
+    "  [1] Power On",
+    "  [2] Power Off",
+    "  [3] Check Power State",
+    "  [0] Back",
+]) + "\n"
+
+_SOURCE_MENU_OPTIONS = "\n".join([
+    "",
+    "  [1] HDMI 1",
+    "  [2] USB-A (Flash Drive)",
+    "  [3] SD Card",
+    "  [4] Android Home",
+    "  [0] Back",
+]) + "\n"
+
+_DISPLAY_MENU_OPTIONS = "\n".join([
+    "",
+    "  [1] Presentation (PC)      [2] Bright         [3] Cinema",
+    "  [4] sRGB                   [5] Photo (Vivid)  [6] Eco",
+    "  [7] 3D                     [8] Game           [9] HDR",
+    "  [A] HLG                    [B] AI-PQ          [C] WCG",
+    "  [D] Projection Mode        [E] Aspect Ratio   [F] Digital Zoom",
+    "  [0] Back",
+]) + "\n"
+
+_PROJECTION_MODE_OPTIONS = "\n".join([
+    "",
+    "  [1] Front-Desktop",
+    "  [2] Rear-Desktop",
+    "  [3] Front-Ceiling",
+    "  [4] Rear-Ceiling",
+]) + "\n"
+
+_ASPECT_RATIO_OPTIONS = "\n".join([
+    "",
+    "  [1] 4:3",
+    "  [2] 16:9",
+    "  [3] 16:10",
+    "  [4] Auto",
+]) + "\n"
+
+_IMAGE_MENU_OPTIONS = "\n".join([
+    "",
+    "  [1] Set Brightness         [2] Set Contrast",
+    "  [3] Color Temperature      [4] Freeze On/Off",
+    "  [5] Auto Keystone          [0] Back",
+]) + "\n"
+
+_AUDIO_MENU_OPTIONS = "\n".join([
+    "",
+    "  [1] Volume Up              [2] Volume Down",
+    "  [3] Audio Mute On          [4] Audio Mute Off",
+    "  [5] AV Mute On             [6] AV Mute Off",
+    "  [0] Back",
+]) + "\n"
+
+_REMOTE_MENU_STR = "\n".join([
+    "\n--- REMOTE FUNCTIONS ---",
+    "  [1] Menu",
+    "  [2] Up        [3] Down",
+    "  [4] Left      [5] Right",
+    "  [6] Enter",
+    "  [0] Back",
+]) + "\n"
+
+_SYSTEM_INFO_HEADER = "\n".join([
+    "\n" + "=" * 70,
+    "SYSTEM INFORMATION",
+    "=" * 70,
+]) + "\n"
+
+_ADVANCED_MENU_OPTIONS = "\n".join([
+    "",
+    "  [1] Digital Signage On     [2] Digital Signage Off",
+    "  [3] Set Language           [4] Reset OSD Settings",
+    "  [5] Factory Reset          [0] Back",
+]) + "\n"
+
+_LANGUAGES_STR = "\n".join([
+    "\nLanguages: 1=English, 2=German, 3=French, 4=Italian,",
+    "           5=Spanish, 6=Portuguese, 7=Polish, 8=Dutch,",
+    "           9=Swedish, 17=Russian, 20=Arabic, 22=Turkish",
+]) + "\n"
+
+_DIGITAL_ZOOM_OPTIONS = "\n".join([
+    "",
+    "  [1] 50%    [2] 75%    [3] 100%",
+    "  [4] 125%   [5] 150%   [6] 175%   [7] 200%",
+]) + "\n"
+
+_CONFIG_MENU_STR = "\n".join([
+    "\n--- CONFIG MANAGEMENT ---",
+    "  [1] Save Config to JSON",
+    "  [2] Save Config to YAML",
+    "  [3] Load Config from File",
+    "  [4] Show Current Config",
+    "  [0] Back",
+]) + "\n"
+
+_CURRENT_CONFIG_HEADER = "\n".join([
+    "\n" + "=" * 70,
+    "CURRENT CONFIGURATION",
+    "=" * 70,
+]) + "\n"
+
+_QUICK_STATUS_HEADER = "\n".join([
+    "\n" + "=" * 70,
+    "QUICK STATUS",
+    "=" * 70,
+]) + "\n"
+
+
+# Main menu choice -> ProjectorCLI method name
+_MAIN_MENU_ACTIONS = {
+    '1': 'power_menu',
+    '2': 'source_menu',
+    '3': 'display_menu',
+    '4': 'image_menu',
+    '5': 'audio_menu',
+    '6': 'remote_menu',
+    '7': 'system_info_menu',
+    '8': 'advanced_menu',
+    '9': 'quick_status',
+    'C': 'config_menu',
+}
+
+# Menu choice -> (controller method name, success message)
+_DISPLAY_ACTIONS = {
+    '1': ('set_display_mode_presentation', "Set to Presentation mode"),
+    '2': ('set_display_mode_bright', "Set to Bright mode"),
+    '3': ('set_display_mode_cinema', "Set to Cinema mode"),
+    '4': ('set_display_mode_srgb', "Set to sRGB mode"),
+    '5': ('set_display_mode_photo', "Set to Photo mode"),
+    '6': ('set_display_mode_eco', "Set to Eco mode"),
+    '7': ('set_display_mode_3d', "Set to 3D mode"),
+    '8': ('set_display_mode_game', "Set to Game mode"),
+    '9': ('set_display_mode_hdr', "Set to HDR mode"),
+    'A': ('set_display_mode_hlg', "Set to HLG mode"),
+    'B': ('set_display_mode_ai_pq', "Set to AI-PQ mode"),
+    'C': ('set_display_mode_wcg', "Set to WCG mode"),
+}
+
+_PROJECTION_ACTIONS = {
+    '1': ('set_projection_front_desktop', "Set to Front-Desktop"),
+    '2': ('set_projection_rear_desktop', "Set to Rear-Desktop"),
+    '3': ('set_projection_front_ceiling', "Set to Front-Ceiling"),
+    '4': ('set_projection_rear_ceiling', "Set to Rear-Ceiling"),
+}
+
+_ASPECT_ACTIONS = {
+    '1': ('set_aspect_4_3', "Set to 4:3"),
+    '2': ('set_aspect_16_9', "Set to 16:9"),
+    '3': ('set_aspect_16_10', "Set to 16:10"),
+    '4': ('set_aspect_auto', "Set to Auto"),
+}
+
+_AUDIO_ACTIONS = {
+    '1': ('volume_up', "Volume increased"),
+    '2': ('volume_down', "Volume decreased"),
+    '3': ('audio_mute_on', "Audio mute ON"),
+    '4': ('audio_mute_off', "Audio mute OFF"),
+    '5': ('av_mute_on', "AV mute ON"),
+    '6': ('av_mute_off', "AV mute OFF"),
+}
+
+_REMOTE_ACTIONS = {
+    '1': ('remote_menu', "Menu button pressed"),
+    '2': ('remote_up', "Up"),
+    '3': ('remote_down', "Down"),
+    '4': ('remote_left', "Left"),
+    '5': ('remote_right', "Right"),
+    '6': ('remote_enter', "Enter"),
+}
+
+_ADVANCED_ACTIONS = {
+    '1': ('set_digital_signage_on', "Digital signage enabled"),
+    '2': ('set_digital_signage_off', "Digital signage disabled"),
+}
+
+# Image menu choice -> (option line, second-level actions)
+_IMAGE_SUBCHOICES = {
+    '3': ("\n  [1] Standard  [2] Cold  [3] Warm", {
+        '1': ('set_color_temp_standard', "Set to Standard"),
+        '2': ('set_color_temp_cold', "Set to Cold"),
+        '3': ('set_color_temp_warm', "Set to Warm"),
+    }),
+    '4': ("\n  [1] Freeze On  [2] Freeze Off", {
+        '1': ('freeze_on', "Freeze enabled"),
+        '2': ('freeze_off', "Freeze disabled"),
+    }),
+    '5': ("\n  [1] Auto Keystone On  [2] Auto Keystone Off", {
+        '1': ('set_auto_keystone_on', "Auto keystone enabled"),
+        '2': ('set_auto_keystone_off', "Auto keystone disabled"),
+    }),
+}
+
+# Digital zoom level (menu choice - 1) -> label
+_ZOOM_LABELS = ('50%', '75%', '100%', '125%', '150%', '175%', '200%')
+
+# Source menu choice -> (controller method name, source label)
+_SOURCE_ACTIONS = {
+    '1': ('set_source_hdmi', "HDMI 1"),
+    '2': ('set_source_usb', "USB-A"),
+    '3': ('set_source_sd_card', "SD Card"),
+    '4': ('set_source_android_home', "Android Home"),
+}
+
+# Display menu choice -> (ProjectorCLI submenu method name, batch query passed to it)
+_DISPLAY_SUBMENUS = {
+    'D': ('projection_mode_submenu', 'projection_mode'),
+    'E': ('aspect_ratio_submenu', 'aspect_ratio'),
+    'F': ('digital_zoom_submenu', 'digital_zoom'),
+}
+
+
+def _stdin_ready(timeout):
+    """Return True if a line of console input is ready within timeout seconds"""
+    if msvcrt is not None:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if msvcrt.kbhit():
+                return True
+            time.sleep(0.05)
+        return False
+    return bool(select.select([sys.stdin], [], [], timeout)[0])
+
+
+class _StatusHeader:
+    """Status lines shown above a submenu, re-read only when they may be stale"""
+
+    def __init__(self, proj, render):
+        """
+        Args:
+            proj: ProjectorController whose generation marks state changes
+            render: Zero-argument callable that queries and formats the lines
+        """
+        self.proj = proj
+        self.render = render
+        self.text = None
+        self.generation = None
+
+    def current(self):
+        """Return the header, re-reading it after a state-changing command"""
+        if self.generation != self.proj.generation:
+            self.refresh()
+        return self.text
+
+    def refresh(self):
+        """Re-read the header. Returns the new text if it changed, else None"""
+        text = self.render()
+        self.generation = self.proj.generation
+        if text == self.text:
+            return None
+        self.text = text
+        return text
 
 
 class ProjectorCLI:
@@ -15,52 +312,161 @@ class ProjectorCLI:
     def __init__(self, port='COM10'):
         self.proj = ProjectorController(port=port)
         self.running = False
+        # Single worker: the serial port still handles one query at a time
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._config_mgr = None
+        self._readline = sys.stdin.readline
+
+    @cached_property
+    def _is_tty(self):
+        """Whether stdin is an interactive terminal (probed once)"""
+        return sys.stdin.isatty()
+
+    @property
+    def config_mgr(self):
+        """ProjectorConfig for this session, created on first use"""
+        if self._config_mgr is None:
+            self._config_mgr = ProjectorConfig(self.proj)
+        return self._config_mgr
+
+    def _input_with_refresh(self, prompt, refresh_fn, interval=2.0):
+        """
+        Prompt for input, refreshing status while the user is idle
+
+        Args:
+            prompt: Prompt text
+            refresh_fn: Called every interval seconds without input; returns
+                changed status text to print, or None
+            interval: Seconds between refreshes
+
+        Returns:
+            The entered line (without newline)
+        """
+        if not self._is_tty:
+            return self._prompt(prompt)
+
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        while not _stdin_ready(interval):
+            text = refresh_fn()
+            if text:
+                sys.stdout.write(f"\n{text}\n{prompt}")
+                sys.stdout.flush()
+
+        return self._prompt()
+
+    def _prompt(self, prompt=''):
+        """
+        Write the prompt and read one line from stdin
+
+        Terminals go through input() to keep line editing and history; piped
+        input is read directly, skipping input()'s per-call terminal checks.
+
+        Args:
+            prompt: Prompt text
+
+        Returns:
+            The entered line (without newline)
+        """
+        if self._is_tty:
+            return input(prompt)
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        line = self._readline()
+        if not line:
+            raise EOFError
+        return line.rstrip('\n')
+
+    def fetch(self, fields, timeout=30.0):
+        """
+        Read a status bundle on the background worker
+
+        Args:
+            fields: Query names from ProjectorController.BATCH_QUERIES
+            timeout: Seconds to wait for the replies
+
+        Returns:
+            Dict of name -> value (all None if the read failed or timed out)
+        """
+        def read():
+            with self.proj.batch_cache():
+                return self.proj.get_status_bundle(fields)
+
+        future = self._executor.submit(read)
+        done, _ = wait([future], timeout=timeout)
+        if done and future.exception() is None:
+            return future.result()
+        if not future.cancel():
+            # Already running: the controller is not ours again until it returns
+            wait([future])
+        return dict.fromkeys(fields)
+
+    def _read_int(self, prompt, lo, hi):
+        """
+        Prompt for an integer in [lo, hi]
+
+        Returns:
+            The value, or None if the input is not a number in range
+        """
+        text = self._prompt(prompt).strip()
+        # At most one leading sign, as parse_int accepts
+        if not (text[1:] if text.startswith('-') else text).isdecimal():
+            return None
+        value = int(text)
+        return value if lo <= value <= hi else None
+
+    def _run_action(self, actions, choice, failure=None):
+        """
+        Run the controller method mapped to a menu choice and report the result
+
+        Args:
+            actions: Dict of choice -> (controller method name, success message)
+            choice: Menu choice (letters match case-insensitively)
+            failure: Message printed if the command fails (None to stay silent)
+
+        Returns:
+            True if choice was found in actions
+        """
+        action = actions.get(choice.upper())
+        if action is None:
+            return False
+        method, message = action
+        if getattr(self.proj, method)():
+            print(f"{_OK} {message}")
+        elif failure:
+            print(failure)
+        return True
 
     def print_header(self):
         """Print CLI header"""
-        print("\n" + "=" * 70)
-        print("  PROJECTOR CONTROL INTERFACE")
-        print("=" * 70)
+        sys.stdout.write(_HEADER_STR)
 
     def print_menu(self):
         """Print main menu"""
-        print("\n" + "-" * 70)
-        print("MAIN MENU")
-        print("-" * 70)
-        print("  [1] Power Control          [2] Source Control")
-        print("  [3] Display Settings       [4] Image Settings")
-        print("  [5] Audio Control          [6] Remote Functions")
-        print("  [7] System Information     [8] Advanced Settings")
-        print("  [9] Quick Status           [C] Config Save/Load")
-        print("  [0] Exit")
-        print("-" * 70)
+        sys.stdout.write(_MAIN_MENU_STR)
 
     def power_menu(self):
         """Power control submenu"""
         while True:
-            print("\n--- POWER CONTROL ---")
-            print("  [1] Power On")
-            print("  [2] Power Off")
-            print("  [3] Check Power State")
-            print("  [0] Back")
+            sys.stdout.write(_POWER_MENU_STR)
 
-            choice = input("\nChoice: ").strip()
+            choice = self._prompt("\nChoice: ").strip()
 
             if choice == '1':
                 print("Turning projector ON...")
                 if self.proj.power_on():
-                    print("✓ Projector is turning on")
+                    print(f"{_OK} Projector is turning on")
                 else:
-                    print("✗ Failed to send power on command")
+                    print(f"{_FAIL} Failed to send power on command")
 
             elif choice == '2':
-                confirm = input("Really power off? (yes/no): ").strip().lower()
+                confirm = self._prompt("Really power off? (yes/no): ").strip().lower()
                 if confirm in ['yes', 'y']:
                     print("Turning projector OFF...")
                     if self.proj.power_off():
-                        print("✓ Projector is turning off")
+                        print(f"{_OK} Projector is turning off")
                     else:
-                        print("✗ Failed to send power off command")
+                        print(f"{_FAIL} Failed to send power off command")
 
             elif choice == '3':
                 state = self.proj.get_power_state()
@@ -69,546 +475,336 @@ class ProjectorCLI:
                 elif state is False:
                     print("Power State: OFF")
                 else:
-                    print("✗ Could not read power state")
+                    print(f"{_FAIL} Could not read power state")
 
             elif choice == '0':
                 break
 
     def source_menu(self):
         """Source control submenu"""
-        while True:
-            print("\n--- SOURCE CONTROL ---")
+        def render():
             current = self.proj.get_input_source()
-            print(f"  Current Source: {current if current else 'Unknown'}")
-            print()
-            print("  [1] HDMI 1")
-            print("  [2] USB-A (Flash Drive)")
-            print("  [3] SD Card")
-            print("  [4] Android Home")
-            print("  [0] Back")
+            return f"  Current Source: {current if current else 'Unknown'}"
 
-            choice = input("\nChoice: ").strip()
+        header = _StatusHeader(self.proj, render)
+        while True:
+            sys.stdout.write(f"\n--- SOURCE CONTROL ---\n{header.current()}\n{_SOURCE_MENU_OPTIONS}")
 
-            if choice == '1':
-                print("Switching to HDMI 1...")
-                if self.proj.set_source_hdmi():
-                    print("✓ Switched to HDMI 1")
-                else:
-                    print("✗ Failed")
+            choice = self._input_with_refresh("\nChoice: ", header.refresh).strip()
 
-            elif choice == '2':
-                print("Switching to USB-A...")
-                if self.proj.set_source_usb():
-                    print("✓ Switched to USB-A")
+            if choice in _SOURCE_ACTIONS:
+                method, label = _SOURCE_ACTIONS[choice]
+                print(f"Switching to {label}...")
+                if getattr(self.proj, method)():
+                    print(f"{_OK} Switched to {label}")
                 else:
-                    print("✗ Failed")
-
-            elif choice == '3':
-                print("Switching to SD Card...")
-                if self.proj.set_source_sd_card():
-                    print("✓ Switched to SD Card")
-                else:
-                    print("✗ Failed")
-
-            elif choice == '4':
-                print("Switching to Android Home...")
-                if self.proj.set_source_android_home():
-                    print("✓ Switched to Android Home")
-                else:
-                    print("✗ Failed")
+                    print(f"{_FAIL} Failed")
 
             elif choice == '0':
                 break
 
     def display_menu(self):
         """Display settings submenu"""
-        while True:
-            print("\n--- DISPLAY SETTINGS ---")
-            current = self.proj.get_display_mode()
-            zoom = self.proj.get_digital_zoom()
-            print(f"  Current Mode: {current if current else 'Unknown'}")
-            print(f"  Digital Zoom: {zoom if zoom else 'Unknown'}")
-            print()
-            print("  [1] Presentation (PC)      [2] Bright         [3] Cinema")
-            print("  [4] sRGB                   [5] Photo (Vivid)  [6] Eco")
-            print("  [7] 3D                     [8] Game           [9] HDR")
-            print("  [A] HLG                    [B] AI-PQ          [C] WCG")
-            print("  [D] Projection Mode        [E] Aspect Ratio   [F] Digital Zoom")
-            print("  [0] Back")
-
-            choice = input("\nChoice: ").strip()
-
-            if choice == '1':
-                if self.proj.set_display_mode_presentation():
-                    print("✓ Set to Presentation mode")
-                else:
-                    print("✗ Failed")
+        # Submenu values are read in the same batch so entering them costs no query
+        status = {}
 
-            elif choice == '2':
-                if self.proj.set_display_mode_bright():
-                    print("✓ Set to Bright mode")
-                else:
-                    print("✗ Failed")
-
-            elif choice == '3':
-                if self.proj.set_display_mode_cinema():
-                    print("✓ Set to Cinema mode")
-                else:
-                    print("✗ Failed")
+        def render():
+            status.update(self.proj.batch_query(
+                ['display_mode', 'digital_zoom', 'projection_mode', 'aspect_ratio']))
+            current, zoom = status['display_mode'], status['digital_zoom']
+            return (f"  Current Mode: {current if current else 'Unknown'}\n"
+                    f"  Digital Zoom: {zoom if zoom else 'Unknown'}")
 
-            elif choice == '4':
-                if self.proj.set_display_mode_srgb():
-                    print("✓ Set to sRGB mode")
-                else:
-                    print("✗ Failed")
-
-            elif choice == '5':
-                if self.proj.set_display_mode_photo():
-                    print("✓ Set to Photo mode")
-                else:
-                    print("✗ Failed")
-
-            elif choice == '6':
-                if self.proj.set_display_mode_eco():
-                    print("✓ Set to Eco mode")
-                else:
-                    print("✗ Failed")
-
-            elif choice == '7':
-                if self.proj.set_display_mode_3d():
-                    print("✓ Set to 3D mode")
-                else:
-                    print("✗ Failed")
+        header = _StatusHeader(self.proj, render)
+        while True:
+            sys.stdout.write(f"\n--- DISPLAY SETTINGS ---\n{header.current()}\n{_DISPLAY_MENU_OPTIONS}")
 
-            elif choice == '8':
-                if self.proj.set_display_mode_game():
-                    print("✓ Set to Game mode")
-                else:
-                    print("✗ Failed")
+            choice = self._input_with_refresh("\nChoice: ", header.refresh).strip()
 
-            elif choice == '9':
-                if self.proj.set_display_mode_hdr():
-                    print("✓ Set to HDR mode")
-                else:
-                    print("✗ Failed")
+            if choice == '0':
+                break
+            elif choice.upper() in _DISPLAY_SUBMENUS:
+                method, query = _DISPLAY_SUBMENUS[choice.upper()]
+                getattr(self, method)(status.get(query))
+            else:
+                self._run_action(_DISPLAY_ACTIONS, choice, f"{_FAIL} Failed")
 
-            elif choice.upper() == 'A':
-                if self.proj.set_display_mode_hlg():
-                    print("✓ Set to HLG mode")
-                else:
-                    print("✗ Failed")
+    def projection_mode_submenu(self, current_mode=None):
+        """
+        Projection mode submenu
 
-            elif choice.upper() == 'B':
-                if self.proj.set_display_mode_ai_pq():
-                    print("✓ Set to AI-PQ mode")
-                else:
-                    print("✗ Failed")
+        Args:
+            current_mode: Value already read by the caller (queried if None)
+        """
+        current = current_mode if current_mode is not None else self.proj.get_projection_mode()
+        sys.stdout.write(f"\n--- PROJECTION MODE ---\n  Current: {current if current else 'Unknown'}\n{_PROJECTION_MODE_OPTIONS}")
 
-            elif choice.upper() == 'C':
-                if self.proj.set_display_mode_wcg():
-                    print("✓ Set to WCG mode")
-                else:
-                    print("✗ Failed")
+        choice = self._prompt("\nChoice: ").strip()
 
-            elif choice.upper() == 'D':
-                self.projection_mode_submenu()
+        self._run_action(_PROJECTION_ACTIONS, choice)
 
-            elif choice.upper() == 'E':
-                self.aspect_ratio_submenu()
+    def aspect_ratio_submenu(self, current_ar=None):
+        """
+        Aspect ratio submenu
 
-            elif choice.upper() == 'F':
-                self.digital_zoom_submenu()
+        Args:
+            current_ar: Value already read by the caller (queried if None)
+        """
+        current = current_ar if current_ar is not None else self.proj.get_aspect_ratio()
+        sys.stdout.write(f"\n--- ASPECT RATIO ---\n  Current: {current if current else 'Unknown'}\n{_ASPECT_RATIO_OPTIONS}")
 
-            elif choice == '0':
-                break
+        choice = self._prompt("\nChoice: ").strip()
 
-    def projection_mode_submenu(self):
-        """Projection mode submenu"""
-        print("\n--- PROJECTION MODE ---")
-        current = self.proj.get_projection_mode()
-        print(f"  Current: {current if current else 'Unknown'}")
-        print()
-        print("  [1] Front-Desktop")
-        print("  [2] Rear-Desktop")
-        print("  [3] Front-Ceiling")
-        print("  [4] Rear-Ceiling")
-
-        choice = input("\nChoice: ").strip()
-
-        if choice == '1':
-            if self.proj.set_projection_front_desktop():
-                print("✓ Set to Front-Desktop")
-        elif choice == '2':
-            if self.proj.set_projection_rear_desktop():
-                print("✓ Set to Rear-Desktop")
-        elif choice == '3':
-            if self.proj.set_projection_front_ceiling():
-                print("✓ Set to Front-Ceiling")
-        elif choice == '4':
-            if self.proj.set_projection_rear_ceiling():
-                print("✓ Set to Rear-Ceiling")
-
-    def aspect_ratio_submenu(self):
-        """Aspect ratio submenu"""
-        print("\n--- ASPECT RATIO ---")
-        current = self.proj.get_aspect_ratio()
-        print(f"  Current: {current if current else 'Unknown'}")
-        print()
-        print("  [1] 4:3")
-        print("  [2] 16:9")
-        print("  [3] 16:10")
-        print("  [4] Auto")
-
-        choice = input("\nChoice: ").strip()
-
-        if choice == '1':
-            if self.proj.set_aspect_4_3():
-                print("✓ Set to 4:3")
-        elif choice == '2':
-            if self.proj.set_aspect_16_9():
-                print("✓ Set to 16:9")
-        elif choice == '3':
-            if self.proj.set_aspect_16_10():
-                print("✓ Set to 16:10")
-        elif choice == '4':
-            if self.proj.set_aspect_auto():
-                print("✓ Set to Auto")
+        self._run_action(_ASPECT_ACTIONS, choice)
 
     def image_menu(self):
         """Image settings submenu"""
+        def render():
+            status = self.proj.batch_query(['brightness', 'contrast', 'color_temperature'])
+            brightness = status['brightness']
+            contrast = status['contrast']
+            color_temp = status['color_temperature']
+            return (f"  Brightness: {brightness if brightness is not None else 'Unknown'}\n"
+                    f"  Contrast: {contrast if contrast is not None else 'Unknown'}\n"
+                    f"  Color Temp: {color_temp if color_temp else 'Unknown'}")
+
+        header = _StatusHeader(self.proj, render)
         while True:
-            print("\n--- IMAGE SETTINGS ---")
-            brightness = self.proj.get_brightness()
-            contrast = self.proj.get_contrast()
-            color_temp = self.proj.get_color_temperature()
-
-            print(f"  Brightness: {brightness if brightness is not None else 'Unknown'}")
-            print(f"  Contrast: {contrast if contrast is not None else 'Unknown'}")
-            print(f"  Color Temp: {color_temp if color_temp else 'Unknown'}")
-            print()
-            print("  [1] Set Brightness         [2] Set Contrast")
-            print("  [3] Color Temperature      [4] Freeze On/Off")
-            print("  [5] Auto Keystone          [0] Back")
+            sys.stdout.write(f"\n--- IMAGE SETTINGS ---\n{header.current()}\n{_IMAGE_MENU_OPTIONS}")
 
-            choice = input("\nChoice: ").strip()
+            choice = self._input_with_refresh("\nChoice: ", header.refresh).strip()
 
             if choice == '1':
-                try:
-                    val = int(input("Enter brightness (0-10): "))
-                    if self.proj.set_brightness(val):
-                        print(f"✓ Brightness set to {val}")
-                    else:
-                        print("✗ Failed (must be 0-10)")
-                except ValueError:
-                    print("✗ Invalid input")
+                val = self._read_int("Enter brightness (0-10): ", 0, 10)
+                if val is None:
+                    print(f"{_FAIL} Invalid input (must be 0-10)")
+                elif self.proj.set_brightness(val):
+                    print(f"{_OK} Brightness set to {val}")
+                else:
+                    print(f"{_FAIL} Failed")
 
             elif choice == '2':
-                try:
-                    val = int(input("Enter contrast (0-10): "))
-                    if self.proj.set_contrast(val):
-                        print(f"✓ Contrast set to {val}")
-                    else:
-                        print("✗ Failed (must be 0-10)")
-                except ValueError:
-                    print("✗ Invalid input")
-
-            elif choice == '3':
-                print("\n  [1] Standard  [2] Cold  [3] Warm")
-                temp_choice = input("Choice: ").strip()
-                if temp_choice == '1':
-                    if self.proj.set_color_temp_standard():
-                        print("✓ Set to Standard")
-                elif temp_choice == '2':
-                    if self.proj.set_color_temp_cold():
-                        print("✓ Set to Cold")
-                elif temp_choice == '3':
-                    if self.proj.set_color_temp_warm():
-                        print("✓ Set to Warm")
+                val = self._read_int("Enter contrast (0-10): ", 0, 10)
+                if val is None:
+                    print(f"{_FAIL} Invalid input (must be 0-10)")
+                elif self.proj.set_contrast(val):
+                    print(f"{_OK} Contrast set to {val}")
+                else:
+                    print(f"{_FAIL} Failed")
 
-            elif choice == '4':
-                print("\n  [1] Freeze On  [2] Freeze Off")
-                freeze_choice = input("Choice: ").strip()
-                if freeze_choice == '1':
-                    if self.proj.freeze_on():
-                        print("✓ Freeze enabled")
-                elif freeze_choice == '2':
-                    if self.proj.freeze_off():
-                        print("✓ Freeze disabled")
-
-            elif choice == '5':
-                print("\n  [1] Auto Keystone On  [2] Auto Keystone Off")
-                ks_choice = input("Choice: ").strip()
-                if ks_choice == '1':
-                    if self.proj.set_auto_keystone_on():
-                        print("✓ Auto keystone enabled")
-                elif ks_choice == '2':
-                    if self.proj.set_auto_keystone_off():
-                        print("✓ Auto keystone disabled")
+            elif choice in _IMAGE_SUBCHOICES:
+                options, actions = _IMAGE_SUBCHOICES[choice]
+                print(options)
+                self._run_action(actions, self._prompt("Choice: ").strip())
 
             elif choice == '0':
                 break
 
     def audio_menu(self):
         """Audio control submenu"""
+        def render():
+            status = self.proj.batch_query(['volume', 'audio_mute', 'av_mute'])
+            volume = status['volume']
+            audio_mute = status['audio_mute']
+            av_mute = status['av_mute']
+            return (f"  Volume: {volume if volume is not None else 'Unknown'}\n"
+                    f"  Audio Mute: {'ON' if audio_mute else 'OFF' if audio_mute is False else 'Unknown'}\n"
+                    f"  AV Mute: {'ON' if av_mute else 'OFF' if av_mute is False else 'Unknown'}")
+
+        header = _StatusHeader(self.proj, render)
         while True:
-            print("\n--- AUDIO CONTROL ---")
-            volume = self.proj.get_volume()
-            audio_mute = self.proj.get_audio_mute_state()
-            av_mute = self.proj.get_av_mute_state()
-
-            print(f"  Volume: {volume if volume is not None else 'Unknown'}")
-            print(f"  Audio Mute: {'ON' if audio_mute else 'OFF' if audio_mute is False else 'Unknown'}")
-            print(f"  AV Mute: {'ON' if av_mute else 'OFF' if av_mute is False else 'Unknown'}")
-            print()
-            print("  [1] Volume Up              [2] Volume Down")
-            print("  [3] Audio Mute On          [4] Audio Mute Off")
-            print("  [5] AV Mute On             [6] AV Mute Off")
-            print("  [0] Back")
-
-            choice = input("\nChoice: ").strip()
+            sys.stdout.write(f"\n--- AUDIO CONTROL ---\n{header.current()}\n{_AUDIO_MENU_OPTIONS}")
 
-            if choice == '1':
-                if self.proj.volume_up():
-                    print("✓ Volume increased")
-            elif choice == '2':
-                if self.proj.volume_down():
-                    print("✓ Volume decreased")
-            elif choice == '3':
-                if self.proj.audio_mute_on():
-                    print("✓ Audio mute ON")
-            elif choice == '4':
-                if self.proj.audio_mute_off():
-                    print("✓ Audio mute OFF")
-            elif choice == '5':
-                if self.proj.av_mute_on():
-                    print("✓ AV mute ON")
-            elif choice == '6':
-                if self.proj.av_mute_off():
-                    print("✓ AV mute OFF")
-            elif choice == '0':
+            choice = self._input_with_refresh("\nChoice: ", header.refresh).strip()
+
+            if choice == '0':
                 break
+            self._run_action(_AUDIO_ACTIONS, choice)
 
     def remote_menu(self):
         """Remote control functions submenu"""
         while True:
-            print("\n--- REMOTE FUNCTIONS ---")
-            print("  [1] Menu")
-            print("  [2] Up        [3] Down")
-            print("  [4] Left      [5] Right")
-            print("  [6] Enter")
-            print("  [0] Back")
+            sys.stdout.write(_REMOTE_MENU_STR)
 
-            choice = input("\nChoice: ").strip()
+            choice = self._prompt("\nChoice: ").strip()
 
-            if choice == '1':
-                self.proj.remote_menu()
-                print("✓ Menu button pressed")
-            elif choice == '2':
-                self.proj.remote_up()
-                print("✓ Up")
-            elif choice == '3':
-                self.proj.remote_down()
-                print("✓ Down")
-            elif choice == '4':
-                self.proj.remote_left()
-                print("✓ Left")
-            elif choice == '5':
-                self.proj.remote_right()
-                print("✓ Right")
-            elif choice == '6':
-                self.proj.remote_enter()
-                print("✓ Enter")
-            elif choice == '0':
+            if choice == '0':
                 break
+            self._run_action(_REMOTE_ACTIONS, choice)
 
     def system_info_menu(self):
         """System information submenu"""
-        print("\n" + "=" * 70)
-        print("SYSTEM INFORMATION")
-        print("=" * 70)
+        sys.stdout.write(_SYSTEM_INFO_HEADER)
 
         # Get comprehensive info
-        info = self.proj.get_system_info()
-        versions = self.proj.get_software_version()
-        mac = self.proj.get_mac_address()
-        device_id = self.proj.get_device_id()
-        temp = self.proj.get_temperature()
-        fans = self.proj.get_fan_speeds()
-        network = self.proj.get_network_status()
-        signal = self.proj.get_signal_status()
-        resolution = self.proj.get_resolution()
-        refresh = self.proj.get_refresh_rate()
-        system_hours = self.proj.get_system_hours()
-
-        print("\nGeneral:")
-        print(f"  Power: {info.get('power', 'Unknown')}")
-        print(f"  Input Source: {info.get('input_source', 'Unknown')}")
-        print(f"  Picture Mode: {info.get('picture_mode', 'Unknown')}")
-        print(f"  Lamp Hours: {info.get('lamp_hours', 'Unknown')}")
-        print(f"  System Hours: {system_hours if system_hours else 'Unknown'}")
-
-        print("\nSoftware:")
-        for key, val in versions.items():
-            print(f"  {key}: {val}")
-
-        print("\nNetwork:")
-        print(f"  MAC Address: {mac if mac else 'Unknown'}")
-        print(f"  WiFi Status: {'Connected' if network else 'Disconnected' if network is False else 'Unknown'}")
-        print(f"  Device ID: {device_id if device_id else 'Unknown'}")
-
-        print("\nSignal:")
-        print(f"  Signal Active: {'Yes' if signal else 'No' if signal is False else 'Unknown'}")
-        print(f"  Resolution: {resolution if resolution else 'Unknown'}")
-        print(f"  Refresh Rate: {refresh if refresh else 'Unknown'}")
-
-        print("\nSystem Status:")
-        print(f"  Temperature: {temp}°C" if temp else "  Temperature: Unknown")
-        print("\n  Fan Speeds:")
-        for fan_name, rpm in fans.items():
-            print(f"    {fan_name}: {rpm} RPM" if rpm else f"    {fan_name}: Unknown")
-
-        print("\n" + "=" * 70)
-        input("\nPress Enter to continue...")
+        print("Fetching system information...")
+        status = self.fetch(['system_info', 'software_version', 'mac_address', 'device_id',
+                             'temperature', 'fans', 'network_status', 'signal_status',
+                             'resolution', 'refresh_rate', 'system_hours'])
+        info = status['system_info'] or {}
+        versions = status['software_version'] or {}
+        fans = status['fans'] or {}
+        mac = status['mac_address']
+        device_id = status['device_id']
+        temp = status['temperature']
+        network = status['network_status']
+        signal = status['signal_status']
+        resolution = status['resolution']
+        refresh = status['refresh_rate']
+        system_hours = status['system_hours']
+
+        lines = [
+            "\nGeneral:",
+            f"  Power: {info.get('power', 'Unknown')}",
+            f"  Input Source: {info.get('input_source', 'Unknown')}",
+            f"  Picture Mode: {info.get('picture_mode', 'Unknown')}",
+            f"  Lamp Hours: {info.get('lamp_hours', 'Unknown')}",
+            f"  System Hours: {system_hours if system_hours else 'Unknown'}",
+            "\nSoftware:",
+        ]
+        lines += [f"  {key}: {val}" for key, val in versions.items()]
+
+        lines += [
+            "\nNetwork:",
+            f"  MAC Address: {mac if mac else 'Unknown'}",
+            f"  WiFi Status: {'Connected' if network else 'Disconnected' if network is False else 'Unknown'}",
+            f"  Device ID: {device_id if device_id else 'Unknown'}",
+
+            "\nSignal:",
+            f"  Signal Active: {'Yes' if signal else 'No' if signal is False else 'Unknown'}",
+            f"  Resolution: {resolution if resolution else 'Unknown'}",
+            f"  Refresh Rate: {refresh if refresh else 'Unknown'}",
+
+            "\nSystem Status:",
+            f"  Temperature: {temp}°C" if temp else "  Temperature: Unknown",
+            "\n  Fan Speeds:",
+        ]
+        lines += [f"    {fan_name}: {rpm} RPM" if rpm else f"    {fan_name}: Unknown"
+                  for fan_name, rpm in fans.items()]
+        lines.append("\n" + "=" * 70)
+
+        # Emit the whole screen in one write
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        self._prompt("\nPress Enter to continue...")
 
     def advanced_menu(self):
         """Advanced settings submenu"""
-        while True:
-            print("\n--- ADVANCED SETTINGS ---")
+        def render():
             ds_status = self.proj.get_digital_signage_status()
-            print(f"  Digital Signage: {'ON' if ds_status else 'OFF' if ds_status is False else 'Unknown'}")
-            print()
-            print("  [1] Digital Signage On     [2] Digital Signage Off")
-            print("  [3] Set Language           [4] Reset OSD Settings")
-            print("  [5] Factory Reset          [0] Back")
+            return f"  Digital Signage: {'ON' if ds_status else 'OFF' if ds_status is False else 'Unknown'}"
 
-            choice = input("\nChoice: ").strip()
+        header = _StatusHeader(self.proj, render)
+        while True:
+            sys.stdout.write(f"\n--- ADVANCED SETTINGS ---\n{header.current()}\n{_ADVANCED_MENU_OPTIONS}")
 
-            if choice == '1':
-                if self.proj.set_digital_signage_on():
-                    print("✓ Digital signage enabled")
-            elif choice == '2':
-                if self.proj.set_digital_signage_off():
-                    print("✓ Digital signage disabled")
+            choice = self._input_with_refresh("\nChoice: ", header.refresh).strip()
+
+            if choice in _ADVANCED_ACTIONS:
+                self._run_action(_ADVANCED_ACTIONS, choice)
             elif choice == '3':
-                print("\nLanguages: 1=English, 2=German, 3=French, 4=Italian,")
-                print("           5=Spanish, 6=Portuguese, 7=Polish, 8=Dutch,")
-                print("           9=Swedish, 17=Russian, 20=Arabic, 22=Turkish")
-                try:
-                    lang = int(input("Enter language code: "))
-                    if self.proj.set_language(lang):
-                        print("✓ Language changed")
-                except ValueError:
-                    print("✗ Invalid input")
+                sys.stdout.write(_LANGUAGES_STR)
+                lang = self._read_int("Enter language code: ", 1, 22)
+                if lang is None:
+                    print(f"{_FAIL} Invalid input")
+                elif self.proj.set_language(lang):
+                    print(f"{_OK} Language changed")
             elif choice == '4':
-                confirm = input("Reset OSD settings? (yes/no): ").strip().lower()
+                confirm = self._prompt("Reset OSD settings? (yes/no): ").strip().lower()
                 if confirm in ['yes', 'y']:
                     if self.proj.reset_osd_settings():
-                        print("✓ OSD settings reset")
+                        print(f"{_OK} OSD settings reset")
             elif choice == '5':
-                confirm = input("FACTORY RESET - Are you SURE? (yes/no): ").strip().lower()
+                confirm = self._prompt("FACTORY RESET - Are you SURE? (yes/no): ").strip().lower()
                 if confirm == 'yes':
                     if self.proj.factory_reset():
-                        print("✓ Factory reset initiated")
+                        print(f"{_OK} Factory reset initiated")
             elif choice == '0':
                 break
 
-    def digital_zoom_submenu(self):
-        """Digital zoom submenu"""
-        print("\n--- DIGITAL ZOOM ---")
-        current = self.proj.get_digital_zoom()
-        print(f"  Current: {current if current else 'Unknown'}")
-        print()
-        print("  [1] 50%    [2] 75%    [3] 100%")
-        print("  [4] 125%   [5] 150%   [6] 175%   [7] 200%")
+    def digital_zoom_submenu(self, current_zoom=None):
+        """
+        Digital zoom submenu
 
-        choice = input("\nChoice: ").strip()
+        Args:
+            current_zoom: Value already read by the caller (queried if None)
+        """
+        current = current_zoom if current_zoom is not None else self.proj.get_digital_zoom()
+        sys.stdout.write(f"\n--- DIGITAL ZOOM ---\n  Current: {current if current else 'Unknown'}\n{_DIGITAL_ZOOM_OPTIONS}")
 
-        zoom_map = {'1': 0, '2': 1, '3': 2, '4': 3, '5': 4, '6': 5, '7': 6}
-        zoom_labels = {0: '50%', 1: '75%', 2: '100%', 3: '125%', 4: '150%', 5: '175%', 6: '200%'}
+        choice = self._prompt("\nChoice: ").strip()
 
-        if choice in zoom_map:
-            level = zoom_map[choice]
+        if choice.isdecimal() and 1 <= int(choice) <= len(_ZOOM_LABELS):
+            level = int(choice) - 1
             if self.proj.set_digital_zoom(level):
-                print(f"✓ Digital zoom set to {zoom_labels[level]}")
+                print(f"{_OK} Digital zoom set to {_ZOOM_LABELS[level]}")
             else:
-                print("✗ Failed")
+                print(f"{_FAIL} Failed")
 
     def config_menu(self):
         """Config save/load submenu"""
         while True:
-            print("\n--- CONFIG MANAGEMENT ---")
-            print("  [1] Save Config to JSON")
-            print("  [2] Save Config to YAML")
-            print("  [3] Load Config from File")
-            print("  [4] Show Current Config")
-            print("  [0] Back")
+            sys.stdout.write(_CONFIG_MENU_STR)
 
-            choice = input("\nChoice: ").strip()
+            choice = self._prompt("\nChoice: ").strip()
 
             if choice == '1':
-                filename = input("Enter filename (e.g., my_config.json): ").strip()
+                filename = self._prompt("Enter filename (e.g., my_config.json): ").strip()
                 if not filename:
-                    print("✗ Filename required")
+                    print(f"{_FAIL} Filename required")
                     continue
 
-                config_mgr = ProjectorConfig(self.proj)
-                if config_mgr.save_to_file(filename, format='json'):
-                    print(f"✓ Config saved to {filename}")
+                if self.config_mgr.save_to_file(filename, format='json'):
+                    print(f"{_OK} Config saved to {filename}")
                 else:
-                    print("✗ Failed to save config")
+                    print(f"{_FAIL} Failed to save config")
 
             elif choice == '2':
-                filename = input("Enter filename (e.g., my_config.yaml): ").strip()
+                filename = self._prompt("Enter filename (e.g., my_config.yaml): ").strip()
                 if not filename:
-                    print("✗ Filename required")
+                    print(f"{_FAIL} Filename required")
                     continue
 
-                config_mgr = ProjectorConfig(self.proj)
-                if config_mgr.save_to_file(filename, format='yaml'):
-                    print(f"✓ Config saved to {filename}")
+                if self.config_mgr.save_to_file(filename, format='yaml'):
+                    print(f"{_OK} Config saved to {filename}")
                 else:
-                    print("✗ Failed to save config")
+                    print(f"{_FAIL} Failed to save config")
 
             elif choice == '3':
-                filename = input("Enter filename to load: ").strip()
+                filename = self._prompt("Enter filename to load: ").strip()
                 if not filename:
-                    print("✗ Filename required")
+                    print(f"{_FAIL} Filename required")
                     continue
 
                 if not Path(filename).exists():
-                    print(f"✗ File not found: {filename}")
+                    print(f"{_FAIL} File not found: {filename}")
                     continue
 
-                include_power = input("Include power state? (yes/no): ").strip().lower()
+                include_power = self._prompt("Include power state? (yes/no): ").strip().lower()
                 skip_power = include_power not in ['yes', 'y']
 
-                config_mgr = ProjectorConfig(self.proj)
-                results = config_mgr.restore_from_file(filename, skip_power=skip_power)
+                results = self.config_mgr.restore_from_file(filename, skip_power=skip_power)
 
-                print("\n=== Results ===")
-                print(f"✓ Success: {len(results['success'])}")
-                for item in results['success'][:5]:  # Show first 5
-                    print(f"  - {item}")
-                if len(results['success']) > 5:
-                    print(f"  ... and {len(results['success']) - 5} more")
+                succeeded = len(results['success'])
+                lines = ["\n=== Results ===", f"{_OK} Success: {succeeded}"]
+                lines += [f"  - {format_result(item)}" for item in islice(results['success'], 5)]  # Show first 5
+                if succeeded > 5:
+                    lines.append(f"  ... and {succeeded - 5} more")
 
                 if results['failed']:
-                    print(f"\n✗ Failed: {len(results['failed'])}")
-                    for item in results['failed']:
-                        print(f"  - {item}")
+                    lines.append(f"\n{_FAIL} Failed: {len(results['failed'])}")
+                    lines += [f"  - {format_result(item)}" for item in results['failed']]
 
                 if results['skipped']:
-                    print(f"\n⊝ Skipped: {len(results['skipped'])}")
+                    lines.append(f"\n{_SKIP} Skipped: {len(results['skipped'])}")
+                print("\n".join(lines))
 
-                input("\nPress Enter to continue...")
+                self._prompt("\nPress Enter to continue...")
 
             elif choice == '4':
-                config_mgr = ProjectorConfig(self.proj)
-                config = config_mgr.capture_config()
+                config = self.config_mgr.capture_config(include_system_info=True)
 
-                print("\n" + "=" * 70)
-                print("CURRENT CONFIGURATION")
-                print("=" * 70)
+                sys.stdout.write(_CURRENT_CONFIG_HEADER)
 
                 for section, settings in config.items():
                     if section != 'metadata':
@@ -617,20 +813,19 @@ class ProjectorCLI:
                             print(f"  {key}: {value}")
 
                 print("=" * 70)
-                input("\nPress Enter to continue...")
+                self._prompt("\nPress Enter to continue...")
 
             elif choice == '0':
                 break
 
     def quick_status(self):
         """Display quick status summary"""
-        print("\n" + "=" * 70)
-        print("QUICK STATUS")
-        print("=" * 70)
+        sys.stdout.write(_QUICK_STATUS_HEADER)
 
-        info = self.proj.get_system_info()
-        volume = self.proj.get_volume()
-        temp = self.proj.get_temperature()
+        status = self.fetch(['system_info', 'volume', 'temperature'])
+        info = status['system_info'] or {}
+        volume = status['volume']
+        temp = status['temperature']
 
         print(f"\n  Power: {info.get('power', 'Unknown')}")
         print(f"  Source: {info.get('input_source', 'Unknown')}")
@@ -640,7 +835,7 @@ class ProjectorCLI:
         print(f"  Runtime: {info.get('lamp_hours', 'Unknown')} hours")
 
         print("=" * 70)
-        input("\nPress Enter to continue...")
+        self._prompt("\nPress Enter to continue...")
 
     def run(self):
         """Run the interactive CLI"""
@@ -649,51 +844,43 @@ class ProjectorCLI:
         # Try to connect
         print("\nConnecting to projector...")
         if not self.proj.connect():
-            print("✗ Failed to connect to projector")
+            print(f"{_FAIL} Failed to connect to projector")
             print("  Check that COM10 is correct and projector is connected")
             return
 
-        print("✓ Connected successfully")
+        print(f"{_OK} Connected successfully")
+
+        # Release the port even if the process is terminated
+        atexit.register(self.proj.disconnect)
+        try:
+            signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+        except ValueError:
+            pass  # not running in the main thread
 
         self.running = True
+        dispatch = {key: getattr(self, name) for key, name in _MAIN_MENU_ACTIONS.items()}
 
         try:
             while self.running:
                 self.print_menu()
-                choice = input("\nChoice: ").strip()
-
-                if choice == '1':
-                    self.power_menu()
-                elif choice == '2':
-                    self.source_menu()
-                elif choice == '3':
-                    self.display_menu()
-                elif choice == '4':
-                    self.image_menu()
-                elif choice == '5':
-                    self.audio_menu()
-                elif choice == '6':
-                    self.remote_menu()
-                elif choice == '7':
-                    self.system_info_menu()
-                elif choice == '8':
-                    self.advanced_menu()
-                elif choice == '9':
-                    self.quick_status()
-                elif choice.upper() == 'C':
-                    self.config_menu()
+                choice = self._prompt("\nChoice: ").strip()
+
+                handler = dispatch.get(choice.upper())
+                if handler:
+                    handler()
                 elif choice == '0':
                     print("\nExiting...")
                     self.running = False
                 else:
-                    print("✗ Invalid choice")
+                    print(f"{_FAIL} Invalid choice")
 
         except KeyboardInterrupt:
             print("\n\nInterrupted by user")
 
         finally:
+            self._executor.shutdown(wait=False, cancel_futures=True)
             self.proj.disconnect()
-            print("✓ Disconnected")
+            print(f"{_OK} Disconnected")
 
 
 if __name__ == "__main__":
@@ -4,83 +4,329 @@ Projector Configuration Save/Load System
 Allows saving and restoring projector settings
 """
 
+import copy
 import json
+import mmap
+import os
+import re
+import time
 import yaml
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Iterator, Optional, Pattern, Tuple
 from projector_control import ProjectorController
 
+# orjson is optional; the stdlib json module is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson is optional; streams JSON arrays of configs one element at a time
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+
+def _compile_table(entries) -> Tuple[Pattern, Dict[str, str]]:
+    """
+    Compile a match table into one regex plus a token -> method lookup
+
+    Args:
+        entries: Sequence of (substring tokens, controller method name)
+
+    Returns:
+        (pattern matching any casefolded token, casefolded token -> method)
+    """
+    methods = {token.casefold(): method for tokens, method in entries for token in tokens}
+    # Longest first so e.g. 'ai-pq' is not cut short by a shorter token
+    alternatives = sorted(methods, key=len, reverse=True)
+    return re.compile('|'.join(map(re.escape, alternatives))), methods
+
+
+def format_result(item: Tuple[str, Any]) -> str:
+    """
+    Format one apply_config result entry for display
+
+    Args:
+        item: (field, value) tuple, value None when the entry has none
+
+    Returns:
+        'field=value', or just 'field'
+    """
+    field, value = item
+    return field if value is None else f"{field}={value}"
+
+
+def _group_fields(fields) -> Tuple[Tuple[str, Tuple[Tuple[str, str], ...]], ...]:
+    """
+    Group (section, key, query) fields by section, keeping first-seen order
+
+    Args:
+        fields: Sequence of (section, key, query)
+
+    Returns:
+        ((section, ((key, query), ...)), ...) so a config is built in one pass
+    """
+    sections = {}
+    for section, key, query in fields:
+        sections.setdefault(section, []).append((key, query))
+    return tuple((section, tuple(items)) for section, items in sections.items())
+
 
 class ProjectorConfig:
     """Manage projector configuration save/load operations"""
 
-    def __init__(self, controller: ProjectorController):
+    # Setting value matching -> controller method; each table is scanned as
+    # one regex and the leftmost token found in the value wins
+    _SOURCE_TABLE = _compile_table((
+        (('hdmi',), 'set_source_hdmi'),
+        (('usb',), 'set_source_usb'),
+        (('sd',), 'set_source_sd_card'),
+        (('android', 'home'), 'set_source_android_home'),
+    ))
+    _DISPLAY_MODE_TABLE = _compile_table((
+        (('presentation', 'pc'), 'set_display_mode_presentation'),
+        (('bright',), 'set_display_mode_bright'),
+        (('cinema',), 'set_display_mode_cinema'),
+        (('srgb',), 'set_display_mode_srgb'),
+        (('3d',), 'set_display_mode_3d'),
+        (('game',), 'set_display_mode_game'),
+        (('hdr',), 'set_display_mode_hdr'),
+        (('hlg',), 'set_display_mode_hlg'),
+        (('ai-pq', 'aipq'), 'set_display_mode_ai_pq'),
+        (('wcg',), 'set_display_mode_wcg'),
+        (('photo', 'vivid'), 'set_display_mode_photo'),
+        (('eco',), 'set_display_mode_eco'),
+    ))
+    _PROJECTION_TABLE = _compile_table((
+        (('front-desktop',), 'set_projection_front_desktop'),
+        (('rear-desktop',), 'set_projection_rear_desktop'),
+        (('front-ceiling',), 'set_projection_front_ceiling'),
+        (('rear-ceiling',), 'set_projection_rear_ceiling'),
+    ))
+    _ASPECT_TABLE = _compile_table((
+        (('4:3',), 'set_aspect_4_3'),
+        (('16:9',), 'set_aspect_16_9'),
+        (('16:10',), 'set_aspect_16_10'),
+        (('auto',), 'set_aspect_auto'),
+    ))
+    _COLOR_TEMP_TABLE = _compile_table((
+        (('standard',), 'set_color_temp_standard'),
+        (('cold',), 'set_color_temp_cold'),
+        (('warm',), 'set_color_temp_warm'),
+    ))
+
+    # (section, key, BATCH_QUERIES name) for every captured setting, in file order
+    _CAPTURE_FIELDS = (
+        ('metadata', 'captured_at', 'captured_at'),  # filled in locally, not queried
+        ('metadata', 'device_id', 'device_id'),
+        ('metadata', 'mac_address', 'mac_address'),
+        ('power', 'state', 'power'),
+        ('source', 'input', 'input_source'),
+        ('display', 'mode', 'display_mode'),
+        ('display', 'projection_mode', 'projection_mode'),
+        ('display', 'aspect_ratio', 'aspect_ratio'),
+        ('display', 'digital_zoom', 'digital_zoom'),
+        ('image', 'brightness', 'brightness'),
+        ('image', 'contrast', 'contrast'),
+        ('image', 'color_temperature', 'color_temperature'),
+        ('audio', 'volume', 'volume'),
+        ('audio', 'audio_mute', 'audio_mute'),
+        ('audio', 'av_mute', 'av_mute'),
+        ('geometry', 'v_keystone', 'v_keystone'),
+        # System info (read-only, for reference)
+        ('system_info', 'software_versions', 'software_version'),
+        ('system_info', 'lamp_hours', 'lamp_hours'),
+        ('system_info', 'system_hours', 'system_hours'),
+        ('system_info', 'temperature', 'temperature'),
+        ('system_info', 'fan_speeds', 'fans'),
+        ('system_info', 'network_status', 'network_status'),
+        ('system_info', 'digital_signage', 'digital_signage'),
+    )
+    # include_system_info -> (queries to send, section layout)
+    _CAPTURE_LAYOUTS = {
+        include: (tuple(query for _, _, query in fields[1:]), _group_fields(fields))
+        for include, fields in (
+            (True, _CAPTURE_FIELDS),
+            (False, tuple(field for field in _CAPTURE_FIELDS if field[0] != 'system_info')),
+        )
+    }
+
+    _ZOOM_LEVELS = {'50%': 0, '75%': 1, '100%': 2, '125%': 3, '150%': 4, '175%': 5, '200%': 6}
+
+    # (section, key, kind, argument) for every setting apply_config writes,
+    # in apply order; kind selects the _apply_<kind> handler:
+    #   table  - argument is a match table, value picks the method
+    #   level  - argument is a setter taking the value (0-10)
+    #   zoom   - argument is a setter taking the _ZOOM_LEVELS index
+    #   switch - argument is (on method, off method)
+    #   step   - argument is a method taking the delta from the current value
+    _APPLY_SPEC = (
+        ('source', 'input', 'table', _SOURCE_TABLE),
+        ('display', 'mode', 'table', _DISPLAY_MODE_TABLE),
+        ('display', 'projection_mode', 'table', _PROJECTION_TABLE),
+        ('display', 'aspect_ratio', 'table', _ASPECT_TABLE),
+        ('display', 'digital_zoom', 'zoom', 'set_digital_zoom'),
+        ('image', 'brightness', 'level', 'set_brightness'),
+        ('image', 'contrast', 'level', 'set_contrast'),
+        ('image', 'color_temperature', 'table', _COLOR_TEMP_TABLE),
+        ('audio', 'volume', 'step', 'volume_step'),
+        ('audio', 'audio_mute', 'switch', ('audio_mute_on', 'audio_mute_off')),
+        ('audio', 'av_mute', 'switch', ('av_mute_on', 'av_mute_off')),
+    )
+    # _APPLY_SPEC rows prefixed with their 'section.key' result field
+    _APPLY_ROWS = tuple((f'{section}.{key}', section, key, kind, arg)
+                        for section, key, kind, arg in _APPLY_SPEC)
+
+    # Seconds a captured config is reused while no command has changed state
+    # (front-panel and remote changes are not seen by the controller)
+    CAPTURE_TTL = 1.5
+
+    def __init__(self, controller: ProjectorController, clock: Callable[[], datetime] = datetime.now):
         """
         Initialize config manager
 
         Args:
             controller: ProjectorController instance
+            clock: Returns the time stamped into captured configs (default: datetime.now)
         """
         self.controller = controller
-
-    def capture_config(self) -> Dict[str, Any]:
+        self._clock = clock
+        self._known_dirs = set()  # parent directories already created by write_config
+        self._captured = None  # (controller generation, capture time, include_system_info, config)
+        # Controller method name -> bound method for every method _APPLY_SPEC can call
+        self._methods = {}
+        for _, _, kind, arg in self._APPLY_SPEC:
+            names = arg[1].values() if kind == 'table' else (arg,) if isinstance(arg, str) else arg
+            self._methods.update((name, getattr(controller, name)) for name in names)
+
+    def capture_config(self, include_system_info: bool = False) -> Dict[str, Any]:
         """
         Capture all current projector settings
 
+        Repeated calls reuse the last capture until a state-changing command
+        is sent or CAPTURE_TTL expires.
+
+        Args:
+            include_system_info: Also read the read-only system_info section
+                (versions, hours, temperature, fans), which apply_config ignores
+
         Returns:
             Dictionary containing all readable settings
         """
-        config = {
-            'metadata': {
-                'captured_at': datetime.now().isoformat(),
-                'device_id': self.controller.get_device_id(),
-                'mac_address': self.controller.get_mac_address(),
-            },
-            'power': {},
-            'source': {},
-            'display': {},
-            'image': {},
-            'audio': {},
-            'geometry': {},
-            'system_info': {},
+        if self._captured is not None:
+            generation, captured_at, has_system_info, config = self._captured
+            if (generation == self.controller.generation
+                    and time.monotonic() - captured_at < self.CAPTURE_TTL
+                    and has_system_info >= include_system_info):
+                config = copy.deepcopy(config)
+                if not include_system_info:
+                    config.pop('system_info', None)
+                return config
+
+        generation = self.controller.generation
+        config = self._read_config(include_system_info)
+        self._captured = (generation, time.monotonic(), include_system_info, config)
+        return copy.deepcopy(config)
+
+    def invalidate_cache(self):
+        """Drop the cached capture so the next capture_config() re-reads the projector"""
+        self._captured = None
+
+    def _read_config(self, include_system_info: bool) -> Dict[str, Any]:
+        """Query every readable setting from the projector in one pipelined burst"""
+        queries, sections = self._CAPTURE_LAYOUTS[include_system_info]
+        status = self.controller.get_status_bundle(queries)
+        status['captured_at'] = self._clock().isoformat()
+
+        return {
+            section: {key: status[query] for key, query in fields}
+            for section, fields in sections
         }
 
-        # Power state
-        config['power']['state'] = self.controller.get_power_state()
+    @staticmethod
+    def _match_table(table, value) -> Optional[str]:
+        """
+        Find the controller method for the first table entry matching value
 
-        # Source
-        config['source']['input'] = self.controller.get_input_source()
+        Args:
+            table: Compiled (pattern, token -> method) table
+            value: Setting value as captured (e.g. 'HDMI 1', 'Cinema')
 
-        # Display settings
-        config['display']['mode'] = self.controller.get_display_mode()
-        config['display']['projection_mode'] = self.controller.get_projection_mode()
-        config['display']['aspect_ratio'] = self.controller.get_aspect_ratio()
-        config['display']['digital_zoom'] = self.controller.get_digital_zoom()
+        Returns:
+            Controller method name, or None if no entry matches
+        """
+        pattern, methods = table
+        key = str(value).casefold()
+        # Values that are exactly a token (e.g. 'cinema') need no scan
+        method = methods.get(key)
+        if method is None:
+            match = pattern.search(key)
+            method = methods[match.group(0)] if match else None
+        return method
+
+    def _apply_table(self, table, value, captured=None) -> bool:
+        """
+        Call the controller method for the first table entry matching value
+
+        Args:
+            table: Compiled (pattern, token -> method) table
+            value: Setting value as captured (e.g. 'HDMI 1', 'Cinema')
+            captured: Current value (unused)
 
-        # Image settings
-        config['image']['brightness'] = self.controller.get_brightness()
-        config['image']['contrast'] = self.controller.get_contrast()
-        config['image']['color_temperature'] = self.controller.get_color_temperature()
+        Returns:
+            True if a matching method was called and succeeded
+        """
+        method = self._match_table(table, value)
+        return method is not None and self._methods[method]()
 
-        # Audio settings
-        config['audio']['volume'] = self.controller.get_volume()
-        config['audio']['audio_mute'] = self.controller.get_audio_mute_state()
-        config['audio']['av_mute'] = self.controller.get_av_mute_state()
+    def _apply_level(self, method: str, value, captured=None) -> bool:
+        """Pass value straight to a setter (e.g. set_brightness)"""
+        return self._methods[method](value)
 
-        # Geometry/Keystone
-        config['geometry']['v_keystone'] = self.controller.get_v_keystone()
+    def _apply_zoom(self, method: str, value, captured=None) -> bool:
+        """Translate a zoom label (e.g. '125%') to its level and set it"""
+        level = self._ZOOM_LEVELS.get(value)
+        return level is not None and self._methods[method](level)
 
-        # System info (read-only, for reference)
-        config['system_info']['software_versions'] = self.controller.get_software_version()
-        config['system_info']['lamp_hours'] = self.controller.get_lamp_hours()
-        config['system_info']['system_hours'] = self.controller.get_system_hours()
-        config['system_info']['temperature'] = self.controller.get_temperature()
-        config['system_info']['fan_speeds'] = self.controller.get_fan_speeds()
-        config['system_info']['network_status'] = self.controller.get_network_status()
-        config['system_info']['digital_signage'] = self.controller.get_digital_signage_status()
+    def _apply_switch(self, methods, value, captured=None) -> bool:
+        """Call the on or off method depending on value"""
+        on, off = methods
+        return self._methods[on if value else off]()
 
-        return config
+    def _apply_step(self, method: str, value, captured=None) -> bool:
+        """Step from the current value to value (settings with only +/- commands)"""
+        return captured is not None and self._methods[method](value - captured)
+
+    def _is_current(self, current: Dict[str, Any], section: str, key: str, value, table=None) -> bool:
+        """
+        Check whether a setting already has the requested value
+
+        Args:
+            current: Config from capture_config
+            section: Config section (e.g. 'display')
+            key: Setting key within the section (e.g. 'mode')
+            value: Requested value
+            table: Match table used to canonicalize text values, if any
+
+        Returns:
+            True if the projector already reports the requested value
+        """
+        captured = current.get(section, {}).get(key)
+        if captured is None:
+            return False
+        if table is not None:
+            method = self._match_table(table, value)
+            return method is not None and method == self._match_table(table, captured)
+        return captured == value
 
     def apply_config(self, config: Dict[str, Any], skip_power: bool = True) -> Dict[str, Any]:
         """
@@ -91,7 +337,8 @@ class ProjectorConfig:
             skip_power: If True, don't change power state (default: True)
 
         Returns:
-            Dictionary with results of each setting attempt
+            Dictionary of 'success' / 'failed' / 'skipped' lists of (field, value)
+            tuples; see format_result()
         """
         results = {
             'success': [],
@@ -99,237 +346,116 @@ class ProjectorConfig:
             'skipped': []
         }
 
+        # Settings that already match are skipped instead of rewritten
+        current = self.capture_config()
+
         # Power (usually skip to avoid accidental shutdown)
         if skip_power:
-            results['skipped'].append('power.state')
-        else:
-            if 'power' in config and 'state' in config['power']:
-                power_state = config['power']['state']
-                if power_state is True:
-                    if self.controller.power_on():
-                        results['success'].append('power.state=on')
-                    else:
-                        results['failed'].append('power.state=on')
-                elif power_state is False:
-                    if self.controller.power_off():
-                        results['success'].append('power.state=off')
-                    else:
-                        results['failed'].append('power.state=off')
-
-        # Source
-        if 'source' in config and 'input' in config['source']:
-            source = config['source']['input']
-            success = False
-            if 'HDMI' in str(source):
-                success = self.controller.set_source_hdmi()
-            elif 'USB' in str(source):
-                success = self.controller.set_source_usb()
-            elif 'SD' in str(source):
-                success = self.controller.set_source_sd_card()
-            elif 'Android' in str(source) or 'Home' in str(source):
-                success = self.controller.set_source_android_home()
-
-            if success:
-                results['success'].append(f'source.input={source}')
+            results['skipped'].append(('power.state', None))
+        elif isinstance(power_state := (config.get('power') or {}).get('state'), bool):
+            label = ('power.state', 'on' if power_state else 'off')
+            if self._is_current(current, 'power', 'state', power_state):
+                results['skipped'].append(label)
+            elif (self.controller.power_on if power_state else self.controller.power_off)():
+                results['success'].append(label)
             else:
-                results['failed'].append(f'source.input={source}')
-
-        # Display mode
-        if 'display' in config:
-            display = config['display']
-
-            if 'mode' in display and display['mode']:
-                mode = display['mode']
-                success = False
-                mode_lower = str(mode).lower()
-
-                if 'presentation' in mode_lower or 'pc' in mode_lower:
-                    success = self.controller.set_display_mode_presentation()
-                elif 'bright' in mode_lower:
-                    success = self.controller.set_display_mode_bright()
-                elif 'cinema' in mode_lower:
-                    success = self.controller.set_display_mode_cinema()
-                elif 'srgb' in mode_lower:
-                    success = self.controller.set_display_mode_srgb()
-                elif '3d' in mode_lower:
-                    success = self.controller.set_display_mode_3d()
-                elif 'game' in mode_lower:
-                    success = self.controller.set_display_mode_game()
-                elif 'hdr' in mode_lower:
-                    success = self.controller.set_display_mode_hdr()
-                elif 'hlg' in mode_lower:
-                    success = self.controller.set_display_mode_hlg()
-                elif 'ai-pq' in mode_lower or 'aipq' in mode_lower:
-                    success = self.controller.set_display_mode_ai_pq()
-                elif 'wcg' in mode_lower:
-                    success = self.controller.set_display_mode_wcg()
-                elif 'photo' in mode_lower or 'vivid' in mode_lower:
-                    success = self.controller.set_display_mode_photo()
-                elif 'eco' in mode_lower:
-                    success = self.controller.set_display_mode_eco()
-
-                if success:
-                    results['success'].append(f'display.mode={mode}')
-                else:
-                    results['failed'].append(f'display.mode={mode}')
-
-            # Projection mode
-            if 'projection_mode' in display and display['projection_mode']:
-                proj_mode = display['projection_mode']
-                success = False
-
-                if 'Front-Desktop' in proj_mode:
-                    success = self.controller.set_projection_front_desktop()
-                elif 'Rear-Desktop' in proj_mode:
-                    success = self.controller.set_projection_rear_desktop()
-                elif 'Front-Ceiling' in proj_mode:
-                    success = self.controller.set_projection_front_ceiling()
-                elif 'Rear-Ceiling' in proj_mode:
-                    success = self.controller.set_projection_rear_ceiling()
-
-                if success:
-                    results['success'].append(f'display.projection_mode={proj_mode}')
-                else:
-                    results['failed'].append(f'display.projection_mode={proj_mode}')
-
-            # Aspect ratio
-            if 'aspect_ratio' in display and display['aspect_ratio']:
-                aspect = display['aspect_ratio']
-                success = False
-
-                if '4:3' in aspect:
-                    success = self.controller.set_aspect_4_3()
-                elif '16:9' in aspect:
-                    success = self.controller.set_aspect_16_9()
-                elif '16:10' in aspect:
-                    success = self.controller.set_aspect_16_10()
-                elif 'Auto' in aspect:
-                    success = self.controller.set_aspect_auto()
-
-                if success:
-                    results['success'].append(f'display.aspect_ratio={aspect}')
-                else:
-                    results['failed'].append(f'display.aspect_ratio={aspect}')
-
-            # Digital zoom
-            if 'digital_zoom' in display and display['digital_zoom']:
-                zoom = display['digital_zoom']
-                zoom_map = {
-                    '50%': 0, '75%': 1, '100%': 2, '125%': 3,
-                    '150%': 4, '175%': 5, '200%': 6
-                }
-                if zoom in zoom_map:
-                    if self.controller.set_digital_zoom(zoom_map[zoom]):
-                        results['success'].append(f'display.digital_zoom={zoom}')
-                    else:
-                        results['failed'].append(f'display.digital_zoom={zoom}')
-
-        # Image settings
-        if 'image' in config:
-            image = config['image']
-
-            if 'brightness' in image and image['brightness'] is not None:
-                if self.controller.set_brightness(image['brightness']):
-                    results['success'].append(f"image.brightness={image['brightness']}")
-                else:
-                    results['failed'].append(f"image.brightness={image['brightness']}")
-
-            if 'contrast' in image and image['contrast'] is not None:
-                if self.controller.set_contrast(image['contrast']):
-                    results['success'].append(f"image.contrast={image['contrast']}")
-                else:
-                    results['failed'].append(f"image.contrast={image['contrast']}")
-
-            if 'color_temperature' in image and image['color_temperature']:
-                color_temp = image['color_temperature']
-                success = False
-
-                if 'Standard' in color_temp:
-                    success = self.controller.set_color_temp_standard()
-                elif 'Cold' in color_temp:
-                    success = self.controller.set_color_temp_cold()
-                elif 'Warm' in color_temp:
-                    success = self.controller.set_color_temp_warm()
+                results['failed'].append(label)
 
-                if success:
-                    results['success'].append(f'image.color_temperature={color_temp}')
-                else:
-                    results['failed'].append(f'image.color_temperature={color_temp}')
-
-        # Audio settings
-        if 'audio' in config:
-            audio = config['audio']
-
-            if 'volume' in audio and audio['volume'] is not None:
-                # Can't set volume directly, but we can try to get close
-                current = self.controller.get_volume()
-                target = audio['volume']
-                if current is not None and target is not None:
-                    if target > current:
-                        for _ in range(target - current):
-                            self.controller.volume_up()
-                        results['success'].append(f'audio.volume={target}')
-                    elif target < current:
-                        for _ in range(current - target):
-                            self.controller.volume_down()
-                        results['success'].append(f'audio.volume={target}')
-                    else:
-                        results['success'].append(f'audio.volume={target} (unchanged)')
-
-            if 'audio_mute' in audio and audio['audio_mute'] is not None:
-                if audio['audio_mute']:
-                    if self.controller.audio_mute_on():
-                        results['success'].append('audio.audio_mute=on')
-                    else:
-                        results['failed'].append('audio.audio_mute=on')
-                else:
-                    if self.controller.audio_mute_off():
-                        results['success'].append('audio.audio_mute=off')
-                    else:
-                        results['failed'].append('audio.audio_mute=off')
-
-            if 'av_mute' in audio and audio['av_mute'] is not None:
-                if audio['av_mute']:
-                    if self.controller.av_mute_on():
-                        results['success'].append('audio.av_mute=on')
-                    else:
-                        results['failed'].append('audio.av_mute=on')
-                else:
-                    if self.controller.av_mute_off():
-                        results['success'].append('audio.av_mute=off')
-                    else:
-                        results['failed'].append('audio.av_mute=off')
+        # Everything else is driven by _APPLY_SPEC; the writes are queued and
+        # sent as one burst, then matched back to their settings by position
+        queued = []  # (label, first command index, end index or None if not queued)
+        self.controller.begin_batch()
+        try:
+            for field, section, key, kind, arg in self._APPLY_ROWS:
+                if (value := (config.get(section) or {}).get(key)) is None or value == '':
+                    continue
+
+                label = (field, ('on' if value else 'off') if kind == 'switch' else value)
+                if self._is_current(current, section, key, value, arg if kind == 'table' else None):
+                    results['skipped'].append(label)
+                    continue
+
+                start = self.controller.pending_commands
+                ok = getattr(self, f'_apply_{kind}')(arg, value, current[section][key])
+                queued.append((label, start, self.controller.pending_commands if ok else None))
+        except BaseException:
+            # Send nothing rather than leave the projector half-configured
+            self.controller.discard_batch()
+            raise
+        acks = self.controller.commit_batch()
+
+        for label, start, end in queued:
+            if end is not None and all(acks[start:end]):
+                results['success'].append(label)
+            else:
+                results['failed'].append(label)
 
+        self.invalidate_cache()
         return results
 
-    def save_to_file(self, filepath: str, format: str = 'json') -> bool:
+    def save_to_file(self, filepath: str, format: str = 'json',
+                     include_system_info: bool = False) -> bool:
         """
         Capture current config and save to file
 
+        Reuses a recent capture_config() result while it is still valid, so
+        viewing and then saving the config queries the projector once.
+
         Args:
             filepath: Path to save file
             format: 'json' or 'yaml' (default: 'json')
+            include_system_info: Also save the read-only system_info section
 
         Returns:
             True if successful
         """
         try:
-            config = self.capture_config()
+            config = self.capture_config(include_system_info)
+        except Exception as e:
+            print(f"Error saving config: {e}")
+            return False
+
+        return self.write_config(config, filepath, format)
+
+    def write_config(self, config: Dict[str, Any], filepath: str, format: str = 'json') -> bool:
+        """
+        Save an already captured config to file
 
+        Args:
+            config: Configuration dictionary (from capture_config)
+            filepath: Path to save file
+            format: 'json' or 'yaml' (default: 'json')
+
+        Returns:
+            True if successful
+        """
+        tmp = None
+        try:
             path = Path(filepath)
-            path.parent.mkdir(parents=True, exist_ok=True)
+            if path.parent not in self._known_dirs:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                self._known_dirs.add(path.parent)
 
+            # Serialize up front so the file is written in a single call
             if format.lower() == 'yaml':
-                with open(path, 'w') as f:
-                    yaml.dump(config, f, default_flow_style=False, sort_keys=False)
-            else:  # json
-                with open(path, 'w') as f:
-                    json.dump(config, f, indent=2)
+                data = yaml.dump(config, Dumper=_YamlDumper, default_flow_style=False,
+                                 sort_keys=False).encode('utf-8')
+            elif orjson is not None:  # json
+                data = orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            else:
+                data = json.dumps(config, indent=2).encode('utf-8')
 
+            # Write beside the target and swap it in, so a crash never leaves a partial file
+            tmp = path.with_name(path.name + '.tmp')
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
             return True
 
         except Exception as e:
             print(f"Error saving config: {e}")
+            if tmp is not None and tmp.exists():
+                tmp.unlink()
+            self._known_dirs.clear()  # a directory may have been removed since
             return False
 
     def load_from_file(self, filepath: str) -> Optional[Dict[str, Any]]:
@@ -345,33 +471,81 @@ class ProjectorConfig:
         try:
             path = Path(filepath)
 
+            # Parse straight from a read-only mapping of the file
+            with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if path.suffix in ['.yaml', '.yml']:
+                    return yaml.load(mm, Loader=_YamlLoader)
+                elif orjson is not None:  # assume json
+                    with memoryview(mm) as view:
+                        return orjson.loads(view)
+                else:
+                    return json.loads(mm[:])
+
+        except Exception as e:
+            print(f"Error loading config: {e}")
+            return None
+
+    def iter_configs_from_file(self, filepath: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yield each config stored in a file, parsing one at a time
+
+        A YAML file may hold several '---' separated documents and a JSON
+        file may hold an array of configs; a plain single config yields once.
+
+        Args:
+            filepath: Path to config file
+
+        Yields:
+            Configuration dictionaries in file order
+        """
+        try:
+            path = Path(filepath)
+
             if path.suffix in ['.yaml', '.yml']:
                 with open(path, 'r') as f:
-                    return yaml.safe_load(f)
-            else:  # assume json
-                with open(path, 'r') as f:
-                    return json.load(f)
+                    yield from yaml.load_all(f, Loader=_YamlLoader)
+                return
+
+            with open(path, 'rb') as f:
+                head = f.read(64).lstrip()
+                f.seek(0)
+                if ijson is not None and head.startswith(b'['):
+                    yield from ijson.items(f, 'item')
+                    return
+                data = orjson.loads(f.read()) if orjson is not None else json.load(f)
+            if isinstance(data, list):
+                yield from data
+            else:
+                yield data
 
         except Exception as e:
             print(f"Error loading config: {e}")
-            return None
 
     def restore_from_file(self, filepath: str, skip_power: bool = True) -> Dict[str, Any]:
         """
-        Load config from file and apply to projector
+        Load config(s) from file and apply to projector
+
+        Multi-document files are streamed and applied in order.
 
         Args:
             filepath: Path to config file
             skip_power: If True, don't change power state
 
         Returns:
-            Results dictionary
+            Results dictionary (combined across all configs in the file)
         """
-        config = self.load_from_file(filepath)
-        if config is None:
-            return {'success': [], 'failed': ['load_file'], 'skipped': []}
-
-        return self.apply_config(config, skip_power=skip_power)
+        results = {'success': [], 'failed': [], 'skipped': []}
+        applied = False
+        for config in self.iter_configs_from_file(filepath):
+            if not config:
+                continue
+            for key, items in self.apply_config(config, skip_power=skip_power).items():
+                results[key].extend(items)
+            applied = True
+
+        if not applied:
+            results['failed'].append(('load_file', None))
+        return results
 
 
 def main():
@@ -388,6 +562,8 @@ def main():
                         help='File format (default: json)')
     parser.add_argument('--include-power', action='store_true',
                         help='Include power state when loading config')
+    parser.add_argument('--include-system-info', action='store_true',
+                        help='Include read-only system info when saving config')
 
     args = parser.parse_args()
 
@@ -400,7 +576,8 @@ def main():
 
         if args.action == 'save':
             print(f"Capturing configuration from projector...")
-            if config_manager.save_to_file(args.file, format=args.format):
+            if config_manager.save_to_file(args.file, format=args.format,
+                                           include_system_info=args.include_system_info):
                 print(f"✓ Configuration saved to {args.file}")
             else:
                 print(f"✗ Failed to save configuration")
@@ -411,39 +588,40 @@ def main():
             results = config_manager.restore_from_file(args.file,
                                                        skip_power=not args.include_power)
 
-            print("\n=== Results ===")
-            print(f"✓ Success: {len(results['success'])}")
-            for item in results['success']:
-                print(f"  - {item}")
+            lines = ["\n=== Results ===", f"✓ Success: {len(results['success'])}"]
+            lines += [f"  - {format_result(item)}" for item in results['success']]
 
             if results['failed']:
-                print(f"\n✗ Failed: {len(results['failed'])}")
-                for item in results['failed']:
-                    print(f"  - {item}")
+                lines.append(f"\n✗ Failed: {len(results['failed'])}")
+                lines += [f"  - {format_result(item)}" for item in results['failed']]
 
             if results['skipped']:
-                print(f"\n⊝ Skipped: {len(results['skipped'])}")
-                for item in results['skipped']:
-                    print(f"  - {item}")
+                lines.append(f"\n⊝ Skipped: {len(results['skipped'])}")
+                lines += [f"  - {format_result(item)}" for item in results['skipped']]
+
+            # Emit the whole report in one write
+            sys.stdout.write("\n".join(lines) + "\n")
 
         elif args.action == 'show':
             print("Capturing current configuration...\n")
-            config = config_manager.capture_config()
+            config = config_manager.capture_config(include_system_info=True)
 
             # Print formatted config
-            print("=" * 70)
-            print("PROJECTOR CONFIGURATION")
-            print("=" * 70)
-
-            print(f"\nCaptured: {config['metadata']['captured_at']}")
-            print(f"Device ID: {config['metadata']['device_id']}")
-            print(f"MAC: {config['metadata']['mac_address']}")
+            lines = [
+                "=" * 70,
+                "PROJECTOR CONFIGURATION",
+                "=" * 70,
+                f"\nCaptured: {config['metadata']['captured_at']}",
+                f"Device ID: {config['metadata']['device_id']}",
+                f"MAC: {config['metadata']['mac_address']}",
+            ]
 
             for section, settings in config.items():
                 if section != 'metadata':
-                    print(f"\n[{section.upper()}]")
-                    for key, value in settings.items():
-                        print(f"  {key}: {value}")
+                    lines.append(f"\n[{section.upper()}]")
+                    lines += [f"  {key}: {value}" for key, value in settings.items()]
+
+            sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
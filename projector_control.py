@@ -4,15 +4,246 @@ Comprehensive Projector Control Interface
 Based on ML1050STi / ML750i RS232 Protocol
 """
 
+import collections
+import contextlib
+import functools
+import io
+import math
+import os
+import re
 import serial
+import threading
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Callable, Tuple
+
+
+def parse_bool(response: str) -> Optional[bool]:
+    """Parse an Ok0/Ok1 response. Returns None for anything else"""
+    if response == 'Ok0':
+        return False
+    elif response == 'Ok1':
+        return True
+    return None
+
+
+def parse_int(response: str) -> Optional[int]:
+    """Parse an Ok<number> response. Returns None if not a number"""
+    if response.startswith('Ok'):
+        # Check the digits up front rather than letting int() raise on F/P/garbage
+        data = response[2:]
+        if (data[1:] if data.startswith('-') else data).isdecimal():
+            return int(data)
+    return None
+
+
+def parse_code(response: str, names: Dict[str, str], unknown: Optional[str] = None) -> Optional[str]:
+    """
+    Map the code of an Ok<code> response to its display name
+
+    Args:
+        response: Reply string from the projector
+        names: Code -> name table
+        unknown: Name for codes missing from the table (default 'Unknown (<code>)')
+
+    Returns:
+        The name, or None if the response is not Ok<code>
+    """
+    code = parse_text(response)
+    if code is None:
+        return None
+    return names.get(code, f"Unknown ({code})" if unknown is None else unknown)
+
+
+def is_reply(line: str) -> bool:
+    """Check whether a line is a command reply (Ok<data>, P or F) rather than a broadcast"""
+    return line[:1] in ('O', 'P', 'F')
+
+
+def parse_text(response: str) -> Optional[str]:
+    """Return the data of an Ok<data> response, or None"""
+    if response.startswith('Ok'):
+        return response[2:]
+    return None
+
+
+# '150 1' reply: Okabbbbbccddddee (power, lamp hours, source, firmware, picture mode)
+_SYSTEM_INFO_RE = re.compile(
+    r'Ok(?P<power>.)(?P<lamp_hours>\d{5})(?P<source>..)(?P<firmware>.{4})(?P<mode>..)?')
+
+# '122 1' reply: tag letter + version, e.g. OkCaaMbbRcc or OkCaaMbbLccHddSeeXff
+_VERSION_RE = re.compile(r'([CMRLHSX])([^CMRLHSX]+)')
+_VERSION_TAGS = {'C': 'DDP', 'M': 'MCU', 'R': 'Android', 'L': 'LAN', 'H': 'HDBaseT', 'S': 'System'}
+
+
+# Reply codes -> display names for the mode getters (built once, not per call)
+_SOURCE_NAMES = {'7': 'HDMI 1', '20': 'Android Home (USB-A/SD Card)'}
+_PROJECTION_NAMES = {'0': 'Front-Desktop', '1': 'Rear-Desktop', '2': 'Front-Ceiling', '3': 'Rear-Ceiling'}
+_DISPLAY_MODE_NAMES = {
+    '1': 'Presentation (PC)', '2': 'Bright', '3': 'Cinema', '4': 'sRGB', '9': '3D', '12': 'Game',
+    '14': 'Photo (Vivid)', '21': 'HDR', '25': 'HLG', '41': 'AI-PQ', '42': 'WCG', '43': 'Eco',
+}
+_COLOR_TEMP_NAMES = {'2': 'Standard (D75)', '3': 'Warm (D65)', '5': 'Cold (D83)'}
+_ASPECT_NAMES = {'1': '4:3', '2': '16:9', '3': '16:10', '7': 'Auto'}
+_ZOOM_NAMES = {'0': '50%', '1': '75%', '2': '100%', '3': '125%', '4': '150%', '5': '175%', '6': '200%'}
+
+# '150 1' picture mode codes are two digits and differ from the '123 1' codes
+_SYSTEM_MODE_NAMES = {
+    '01': 'Presentation (PC)', '02': 'Bright', '03': 'Cinema', '04': 'sRGB', '14': 'Photo (Vivid)', '28': 'Eco',
+}
+
+
+class _SharedPort:
+    """An open Serial shared by every controller on the same port"""
+
+    def __init__(self, ser, timeout: float):
+        self.ser = ser
+        self.timeout = timeout  # the opener's; ser.timeout is changed while settling
+        self.lock = threading.Lock()  # held for each write-then-read exchange
+        self.refs = 1
+
+
+# Port name -> _SharedPort; a port can only be opened once (exclusively on Windows)
+_PORTS: Dict[str, _SharedPort] = {}
+_PORTS_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=512)
+def encode_frame(device_id: str, command: str) -> bytes:
+    """
+    Build the wire frame for a command (memoized, commands come from fixed tables)
+
+    Args:
+        device_id: Projector device ID (e.g. '00')
+        command: Command string without prefix or CR (e.g. '20 3')
+
+    Returns:
+        ASCII bytes of '~<id><command>\\r'
+    """
+    return f"~{device_id}{command}\r".encode('ascii')
+
+
+def _cached(ttl: float = math.inf):
+    """
+    Memoize a zero-argument getter for ttl seconds (default: the whole session)
+
+    Keep the default for values that cannot change while connected (MAC,
+    versions...); slow-moving readings take a short ttl. Failed reads
+    (None/empty) are not cached.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self):
+            if self._is_cached(method.__name__):
+                return self._cache[method.__name__][1]
+            value = method(self)
+            if value:
+                self._cache[method.__name__] = (time.monotonic() + ttl, value)
+            return value
+        return wrapper
+    return decorator
 
 
 class ProjectorController:
     """Complete control interface for DDP projector via RS232"""
 
-    def __init__(self, port='COM10', baudrate=9600, device_id='00'):
+    # Query name -> (getter method, commands the getter sends), for batch_query()
+    BATCH_QUERIES = {
+        'power': ('get_power_state', ('124 1',)),
+        'input_source': ('get_input_source', ('121 1',)),
+        'display_mode': ('get_display_mode', ('123 1',)),
+        'projection_mode': ('get_projection_mode', ('129 1',)),
+        'aspect_ratio': ('get_aspect_ratio', ('127 1',)),
+        'digital_zoom': ('get_digital_zoom', ('543 9',)),
+        'brightness': ('get_brightness', ('125 1',)),
+        'contrast': ('get_contrast', ('126 1',)),
+        'color_temperature': ('get_color_temperature', ('128 1',)),
+        'v_keystone': ('get_v_keystone', ('543 3',)),
+        'volume': ('get_volume', ('120 1',)),
+        'audio_mute': ('get_audio_mute_state', ('356 1',)),
+        'av_mute': ('get_av_mute_state', ('355 1',)),
+        'system_info': ('get_system_info', ('150 1',)),
+        'software_version': ('get_software_version', ('122 1',)),
+        'lamp_hours': ('get_lamp_hours', ('108 1',)),
+        'system_hours': ('get_system_hours', ('150 21',)),
+        'temperature': ('get_temperature', ('352 1',)),
+        'fans': ('get_fan_speeds', ('351 0', '351 1', '351 2')),
+        'mac_address': ('get_mac_address', ('555 2',)),
+        'device_id': ('get_device_id', ('558 1',)),
+        'network_status': ('get_network_status', ('451 1',)),
+        'signal_status': ('get_signal_status', ('150 23',)),
+        'resolution': ('get_resolution', ('150 4',)),
+        'refresh_rate': ('get_refresh_rate', ('150 19',)),
+        'digital_signage': ('get_digital_signage_status', ('568 1',)),
+    }
+
+    # Query name -> _SYSTEM_INFO_RE group for values the composite '150 1'
+    # reply also carries (parsed by the query's own getter)
+    SYSTEM_INFO_FIELDS = {
+        'power': 'power',
+        'input_source': 'source',
+        'lamp_hours': 'lamp_hours',
+    }
+
+    # Commands that only read state; anything else may change it
+    QUERY_COMMANDS = frozenset(
+        [cmd for _, cmds in BATCH_QUERIES.values() for cmd in cmds] + ['357 3', '357 4'])
+
+    # Fan number (for '351 n') -> display name
+    FANS = ((0, 'System Fan 1'), (1, 'System Fan 2'), (2, 'Optical Fan'))
+
+    # Setting values -> commands, for apply_settings() and the set_* methods below
+    SOURCES = {
+        'hdmi': '12 1',
+        'usb': '12 17',
+        'sd_card': '12 31',
+        'android_home': '12 24',
+    }
+
+    DISPLAY_MODES = {
+        'presentation': '20 1',
+        'bright': '20 2',
+        'cinema': '20 3',
+        'srgb': '20 4',
+        'photo': '20 16',
+        'eco': '20 44',
+        '3d': '20 9',
+        'game': '20 12',
+        'hdr': '20 21',
+        'hlg': '20 25',
+        'ai_pq': '20 41',
+        'wcg': '20 42',
+    }
+
+    ASPECT_RATIOS = {
+        '4:3': '60 1',
+        '16:9': '60 2',
+        '16:10': '60 3',
+        'auto': '60 7',
+    }
+
+    PROJECTION_MODES = {
+        'front_desktop': '71 1',
+        'rear_desktop': '71 2',
+        'front_ceiling': '71 3',
+        'rear_ceiling': '71 4',
+    }
+
+    COLOR_TEMPS = {
+        'standard': '36 1',
+        'cold': '36 3',
+        'warm': '36 4',
+    }
+
+    REMOTE_KEYS = {
+        'menu': '140 20',
+        'up': '140 10',
+        'left': '140 11',
+        'enter': '140 12',
+        'right': '140 13',
+        'down': '140 14',
+    }
+
+    def __init__(self, port='COM10', baudrate=9600, device_id='00', low_latency=True, timeout=2.0):
         """
         Initialize projector controller
 
@@ -20,17 +251,74 @@ class ProjectorController:
             port: Serial port name (e.g., 'COM10')
             baudrate: Baud rate (default 9600)
             device_id: Projector device ID (00-99, default '00' for broadcast)
+            low_latency: Request low-latency mode from the serial driver on connect
+            timeout: Seconds to wait for a reply before giving up
         """
         self.port = port
         self.baudrate = baudrate
         self.device_id = device_id
+        self.low_latency = low_latency
+        self.timeout = timeout
         self.ser = None
+        self._fd = None  # raw descriptor for the POSIX write fast path
+        self._lock = None  # the shared port's exchange lock while connected
+        self._handle_lock = threading.RLock()  # keeps self.ser in place while a thread uses it
+        self._prefetched = {}
+        self._cache = {}
+        self._response_cache = None
+        self._cache_ttl = 0.0
+        self.generation = 0  # bumped whenever a state-changing command is sent
+        self._deferred = None  # commands queued between begin_batch() and commit_batch()
+        self.last_ok = None  # time.monotonic() of the last completed exchange
+        self.unsolicited = collections.deque(maxlen=64)  # status broadcasts and late replies
+        self.remote_min_interval = 0.0  # drop remote presses closer together than this
+        self._snapshot = {}  # command -> (time, response) kept fresh by start_status_polling()
+        self._snapshot_ttl = 0.0
+        self._poller = None  # (thread, stop event) while polling
+        self._state_lock = threading.Lock()  # generation bumps vs. the poller's snapshot writes
+        self._last_remote = -math.inf
 
     def connect(self):
-        """Open serial connection to projector"""
-        if self.ser and self.ser.is_open:
-            return True
+        """
+        Open serial connection to projector, or join another controller's
 
+        Raises:
+            ValueError: Another controller has the port open with a different
+                baudrate or timeout
+        """
+        with self._handle_lock:
+            if self.ser and self.ser.is_open:
+                return True
+
+            with _PORTS_LOCK:
+                shared = _PORTS.get(self.port)
+                if shared is not None and shared.ser.is_open:
+                    if (shared.ser.baudrate, shared.timeout) != (self.baudrate, self.timeout):
+                        raise ValueError(
+                            f"{self.port} is already open at {shared.ser.baudrate} baud with a "
+                            f"{shared.timeout} s timeout; controllers sharing it must match")
+                    shared.refs += 1
+                    self._join(shared)
+                    return True
+                if self._open():
+                    shared = _SharedPort(self.ser, self.timeout)
+                    self._join(shared)
+                    _PORTS[self.port] = shared  # only once the controller is fully attached
+                    return True
+                return False
+
+    def _join(self, shared: _SharedPort):
+        """Use a registered port's Serial and exchange lock"""
+        self.ser = shared.ser
+        self._lock = shared.lock
+        # POSIX backend only; Windows, loop:// and rfc2217:// have no file descriptor
+        try:
+            self._fd = self.ser.fileno()
+        except (AttributeError, io.UnsupportedOperation, OSError):
+            self._fd = None
+
+    def _open(self) -> bool:
+        """Open and configure the serial port"""
         try:
             self.ser = serial.Serial(
                 port=self.port,
@@ -38,25 +326,137 @@ class ProjectorController:
                 bytesize=serial.EIGHTBITS,
                 parity=serial.PARITY_NONE,
                 stopbits=serial.STOPBITS_ONE,
-                timeout=2,
+                timeout=self.timeout,
                 xonxoff=False,
                 rtscts=False,
                 dsrdtr=False
             )
 
+            # Larger driver queues so batched writes go out in one call
+            # (SetupComm; only the Windows backend provides this)
+            if hasattr(self.ser, 'set_buffer_size'):
+                self.ser.set_buffer_size(rx_size=8192, tx_size=8192)
+
+            if self.low_latency:
+                self.set_low_latency(True)
+
             self.ser.setRTS(True)
             self.ser.setDTR(True)
-            time.sleep(0.2)
+            self._settle()
             return True
 
         except serial.SerialException as e:
             print(f"Connection error: {e}")
             return False
 
+    def _settle(self, quiet: float = 0.05, limit: float = 0.2):
+        """
+        Discard line noise after raising RTS/DTR until the port has been quiet
+
+        Returns at once if the projector asserts DSR or CTS, otherwise after
+        `quiet` seconds with nothing received, or after `limit` seconds at
+        most, rather than always sleeping the full limit. Each read blocks in
+        the driver (select, or an overlapped wait on Windows) instead of
+        sleep-polling.
+        """
+        # A projector that drives DSR/CTS has its UART up already
+        try:
+            ready = self.ser.dsr or self.ser.cts
+        except (serial.SerialException, OSError):
+            ready = False  # no modem lines (virtual or 3-wire ports)
+        if ready:
+            self.ser.reset_input_buffer()
+            return
+
+        deadline = time.monotonic() + limit
+        self.ser.timeout = quiet
+        try:
+            while time.monotonic() < deadline and self.ser.read(self.ser.in_waiting or 1):
+                pass
+        finally:
+            self.ser.timeout = self.timeout
+
+    def is_alive(self, max_idle: float = 30.0) -> bool:
+        """
+        Check that the projector is still answering
+
+        Trusts any exchange completed within max_idle seconds; otherwise
+        probes with a power-state query (reconnecting if the port died).
+
+        Args:
+            max_idle: Seconds a previous reply counts as proof of life
+
+        Returns:
+            True if the projector replied
+        """
+        if self.last_ok is not None and time.monotonic() - self.last_ok < max_idle:
+            return True
+        return self._send_command('124 1').startswith('Ok')
+
+    def set_low_latency(self, enabled: bool = True) -> bool:
+        """
+        Toggle the driver's low-latency mode (ASYNC_LOW_LATENCY on Linux)
+
+        USB-serial adapters otherwise hold short replies for up to 16 ms
+        before delivering them. Not every platform or driver supports this,
+        so failures are ignored.
+
+        On Linux the adapter's sysfs latency_timer (FTDI and similar drivers)
+        is also set to 1 ms (16 ms when disabling), since not every driver
+        maps the ioctl onto it; that usually needs write access to /sys.
+
+        Returns:
+            True if either setting was applied
+        """
+        applied = False
+        try:
+            self.ser.set_low_latency_mode(enabled)
+            applied = True
+        except (AttributeError, NotImplementedError, ValueError, OSError):
+            pass
+
+        # /sys/bus/usb-serial/devices/ttyUSB0/latency_timer
+        device = os.path.basename(os.path.realpath(self.port))
+        timer = f"/sys/bus/usb-serial/devices/{device}/latency_timer"
+        try:
+            with open(timer, 'w') as f:
+                f.write('1' if enabled else '16')
+            applied = True
+        except OSError:
+            pass
+        return applied
+
     def disconnect(self):
-        """Close serial connection"""
-        if self.ser and self.ser.is_open:
-            self.ser.close()
+        """Release the port; the last controller using it drains and closes it (safe to call twice)"""
+        self.stop_status_polling()
+        with self._handle_lock:
+            self._release(broken=False)
+
+    def _release(self, broken: bool):
+        """
+        Detach from the shared port, closing it when no other controller uses it
+
+        Args:
+            broken: The port failed; unregister and close it regardless of other users
+        """
+        ser, self.ser, self._fd, self._lock = self.ser, None, None, None
+        if ser is None:
+            return
+
+        with _PORTS_LOCK:
+            shared = _PORTS.get(self.port)
+            if shared is not None and shared.ser is ser:
+                shared.refs -= 1
+                if shared.refs > 0 and not broken:
+                    return
+                del _PORTS[self.port]
+
+        try:
+            if ser.is_open and not broken:
+                ser.flush()
+            ser.close()
+        except (serial.SerialException, OSError):
+            pass
 
     def _send_command(self, command: str) -> str:
         """
@@ -68,33 +468,448 @@ class ProjectorController:
         Returns:
             Response string from projector
         """
-        if not self.ser or not self.ser.is_open:
-            if not self.connect():
-                return ""
+        if self._deferred is not None and command not in self.QUERY_COMMANDS:
+            self._deferred.append(command)
+            return 'P'
+
+        if command in self._prefetched:
+            return self._prefetched.pop(command)
+
+        if command not in self.QUERY_COMMANDS:
+            self._invalidate()
+        else:
+            cached = self._recall(command)
+            if cached is not None:
+                return cached
+
+        # Every reply ends in CR; returns as soon as it arrives (or on timeout)
+        raw = self._exchange(encode_frame(self.device_id, command), self._read_reply)
+        if raw is None:
+            return ""
+
+        # Plain acknowledgements (the common case) skip decoding
+        response = 'P' if raw == b'P\r' else raw.decode('ascii', errors='ignore').strip()
+        self._remember(command, response)
+        return response
+
+    def _exchange(self, frames: bytes, read: Callable[[], Any]) -> Any:
+        """
+        Write frames and collect the replies, reopening the port once if it failed
+
+        A USB adapter that was unplugged or reset leaves a dead handle behind;
+        the first I/O error closes it, reconnects and retries the exchange.
+
+        Args:
+            frames: Encoded command frames to write
+            read: Callable that reads the replies from self.ser
+
+        Returns:
+            Whatever read() returns, or None if the port is unavailable
+        """
+        # Held across each attempt so the status poller (or another caller) cannot
+        # release self.ser and self._lock between the is_open check and their use
+        with self._handle_lock:
+            for attempt in range(2):
+                if not self.ser or not self.ser.is_open:
+                    if not self.connect():
+                        return None
+                try:
+                    with self._lock:
+                        if self.ser.in_waiting:
+                            self._collect_unsolicited()
+                        self._write(frames)
+                        self.ser.flush()
+                        replies = read()
+                    self.last_ok = time.monotonic()
+                    return replies
+                except (serial.SerialException, OSError) as e:
+                    print(f"Serial error: {e}" + (", reconnecting" if attempt == 0 else ""))
+                    # Drop the handle even if close() fails (which leaves is_open set)
+                    self._release(broken=True)
+            return None
+
+    def _write(self, frames: bytes):
+        """
+        Write frames straight to the port's file descriptor where there is one
+
+        Bypasses pyserial's write-timeout bookkeeping for the short frames this
+        protocol sends; anything the non-blocking descriptor does not take at
+        once goes through Serial.write.
+        """
+        if self._fd is None:
+            self.ser.write(frames)
+            return
+        view = memoryview(frames)
+        try:
+            while view:
+                view = view[os.write(self._fd, view):]
+        except BlockingIOError:
+            self.ser.write(view)
+
+    def _collect_unsolicited(self):
+        """Move lines that arrived outside an exchange into self.unsolicited"""
+        data = self.ser.read(self.ser.in_waiting)
+        for line in data.decode('ascii', errors='ignore').split('\r'):
+            if line.strip():
+                self.unsolicited.append(line.strip())
+
+    def _is_cached(self, getter: str) -> bool:
+        """Check whether a @_cached getter holds an unexpired value"""
+        cached = self._cache.get(getter)
+        return cached is not None and time.monotonic() < cached[0]
+
+    def _invalidate(self):
+        """Record a possible state change: bump generation, drop cached responses"""
+        with self._state_lock:
+            self.generation += 1
+            self._snapshot.clear()
+        if self._response_cache is not None:
+            self._response_cache.clear()
+
+    def _recall(self, command: str) -> Optional[str]:
+        """Return a fresh response from the polled snapshot or an active batch_cache()"""
+        polled = self._snapshot.get(command)
+        if polled and time.monotonic() - polled[0] < self._snapshot_ttl:
+            return polled[1]
+        if self._response_cache is None:
+            return None
+        cached = self._response_cache.get(command)
+        if cached and time.monotonic() - cached[0] < self._cache_ttl:
+            return cached[1]
+        return None
+
+    def _remember(self, command: str, response: str):
+        """Store a query response while batch_cache() is active"""
+        if self._response_cache is not None and response and command in self.QUERY_COMMANDS:
+            self._response_cache[command] = (time.monotonic(), response)
+
+    @contextlib.contextmanager
+    def batch_cache(self, ttl: float = 2.0):
+        """
+        Reuse query responses for up to ttl seconds inside the block
+
+        Any state-changing command clears the cached responses, and they are
+        dropped when the outermost block exits.
+
+        Args:
+            ttl: Maximum age in seconds of a reused response
+        """
+        if self._response_cache is not None:
+            yield self
+            return
+
+        self._response_cache = {}
+        self._cache_ttl = ttl
+        try:
+            yield self
+        finally:
+            self._response_cache = None
+
+    def start_status_polling(self, interval: float = 1.0,
+                             queries: Tuple[str, ...] = ('system_info', 'signal_status', 'resolution', 'refresh_rate')):
+        """
+        Refresh a status snapshot in a background thread
+
+        Every interval seconds the commands behind queries are sent in one
+        batch. Until a reply is 2 * interval old, getters for those values
+        return it without a round-trip. Any state-changing command clears the
+        snapshot. Polling stops on disconnect().
+
+        Args:
+            interval: Seconds between refreshes
+            queries: BATCH_QUERIES names to keep fresh
+        """
+        self.stop_status_polling()
+        commands = [cmd for name in queries for cmd in self.BATCH_QUERIES[name][1]]
+        self._snapshot_ttl = interval * 2
+        stop = threading.Event()
+        thread = threading.Thread(target=self._poll_status, args=(commands, interval, stop), daemon=True)
+        self._poller = (thread, stop)
+        thread.start()
+
+    def stop_status_polling(self):
+        """Stop the background poller and drop its snapshot (safe to call twice)"""
+        if self._poller is not None:
+            thread, stop = self._poller
+            self._poller = None
+            stop.set()
+            thread.join()
+        self._snapshot.clear()
+
+    def _poll_status(self, commands: List[str], interval: float, stop: threading.Event):
+        """Poller thread body: refresh the snapshot until stop is set"""
+        frames = b''.join(encode_frame(self.device_id, command) for command in commands)
+        while True:
+            generation = self.generation
+            replies = self._exchange(frames, lambda: self._read_responses(len(commands)))
+            # Keep the replies only if no state-changing command overtook them
+            with self._state_lock:
+                if replies and generation == self.generation:
+                    now = time.monotonic()
+                    for command, reply in zip(commands, replies):
+                        if reply:
+                            self._snapshot[command] = (now, reply)
+            if stop.wait(interval):
+                return
+
+    def _read_reply(self) -> bytes:
+        """
+        Read one CR-terminated reply, setting aside any broadcast lines before it
+
+        Returns:
+            Raw reply bytes including the CR (b'' or a partial line on timeout)
+        """
+        deadline = time.monotonic() + self.timeout
+        while True:
+            raw = self.ser.read_until(b'\r')
+            if raw == b'P\r' or not raw.endswith(b'\r'):
+                return raw
+            line = raw.decode('ascii', errors='ignore').strip()
+            if is_reply(line) or time.monotonic() >= deadline:
+                return raw
+            if line:
+                self.unsolicited.append(line)
+
+    def _read_responses(self, count: int, timeout: Optional[float] = None) -> List[str]:
+        """
+        Read up to count CR-terminated responses
+
+        Args:
+            count: Number of responses expected
+            timeout: Overall time to wait for all responses (default: self.timeout
+                per response, as the projector answers one command at a time)
+
+        Returns:
+            List of count response strings ('' for any not received)
+        """
+        replies = []
+        pending = b''
+        deadline = time.monotonic() + (self.timeout * count if timeout is None else timeout)
+        while len(replies) < count and time.monotonic() < deadline:
+            chunk = self.ser.read(self.ser.in_waiting or 1)
+            if not chunk:
+                break
+            *lines, pending = (pending + chunk).split(b'\r')
+            for line in lines:
+                line = line.decode('ascii', errors='ignore').strip()
+                if is_reply(line):
+                    replies.append(line)
+                elif line:
+                    self.unsolicited.append(line)
+
+        replies = replies[:count]
+        return replies + [''] * (count - len(replies))
+
+    def send_batch(self, commands: List[str]) -> List[str]:
+        """
+        Send several commands in one write and collect their responses
+
+        Args:
+            commands: Command strings without CR terminator
+
+        Returns:
+            Response strings aligned with commands ('' if none received)
+        """
+        if not commands:
+            return []
+
+        if self._deferred is not None and not any(command in self.QUERY_COMMANDS for command in commands):
+            self._deferred.extend(commands)
+            return ['P'] * len(commands)
+
+        if all(command in self._prefetched for command in commands):
+            return [self._prefetched.pop(command) for command in commands]
+
+        if any(command not in self.QUERY_COMMANDS for command in commands):
+            self._invalidate()
+        else:
+            cached = [self._recall(command) for command in commands]
+            if None not in cached:
+                return cached
+
+        replies = self._exchange(b''.join(encode_frame(self.device_id, command) for command in commands),
+                                 lambda: self._read_responses(len(commands)))
+        if replies is None:
+            return [''] * len(commands)
+        for command, reply in zip(commands, replies):
+            self._remember(command, reply)
+        return replies
+
+    def begin_batch(self):
+        """
+        Queue state-changing commands until commit_batch()
+
+        Setters called in between return as if acknowledged; queries are
+        still sent immediately.
+        """
+        self._deferred = []
+
+    @property
+    def pending_commands(self) -> int:
+        """Number of commands queued since begin_batch()"""
+        return len(self._deferred) if self._deferred is not None else 0
+
+    def commit_batch(self) -> List[bool]:
+        """
+        Send the commands queued since begin_batch() in one write
+
+        Returns:
+            Success flags aligned with the queued commands
+        """
+        commands, self._deferred = self._deferred or [], None
+        return [self._check_success(response) for response in self.send_batch(commands)]
+
+    def discard_batch(self):
+        """Drop the commands queued since begin_batch() without sending them"""
+        self._deferred = None
+
+    def batch_query(self, names: List[str]) -> Dict[str, Any]:
+        """
+        Run several queries in a single round-trip
+
+        All command frames are written back-to-back and the replies read in
+        one pass, then parsed by the regular getters. Commands left
+        unanswered are retried individually; cached getters are not re-sent.
+
+        Args:
+            names: Query names from BATCH_QUERIES (e.g. 'brightness', 'fans')
+
+        Returns:
+            Dictionary mapping each query name to the getter's return value
+        """
+        return self._batch_query(names)
+
+    def _batch_query(self, names: List[str], folded: Tuple[str, ...] = ()) -> Dict[str, Any]:
+        """
+        batch_query() that also reads the folded SYSTEM_INFO_FIELDS out of the
+        '150 1' reply ('system_info' must be among names)
+
+        Each folded getter is handed its part of the composite reply as if it
+        had sent its own query, so the values match a separate read. Folded
+        names are missing from the result if the '150 1' reply did not parse.
+        """
+        commands = [cmd for name in names
+                    if not self._is_cached(self.BATCH_QUERIES[name][0])
+                    for cmd in self.BATCH_QUERIES[name][1]]
+        replies = self.send_batch(commands)
+        self._prefetched = {cmd: reply for cmd, reply in zip(commands, replies) if reply}
+
+        match = _SYSTEM_INFO_RE.match(self._prefetched.get('150 1', ''))
+        if match:
+            for name in folded:
+                # Zero-padded in '150 1' ('07', '01234'), unpadded in the individual replies
+                code = match[self.SYSTEM_INFO_FIELDS[name]].lstrip('0') or '0'
+                self._prefetched[self.BATCH_QUERIES[name][1][0]] = f'Ok{code}'
+            names = [*names, *folded]
+
+        try:
+            return {name: getattr(self, self.BATCH_QUERIES[name][0])() for name in names}
+        finally:
+            self._prefetched = {}
+
+    def get_status_bundle(self, fields=('power', 'input_source', 'display_mode', 'volume',
+                                        'temperature', 'lamp_hours')) -> Dict[str, Any]:
+        """
+        Read a bundle of status values as one pipelined burst
+
+        Args:
+            fields: Query names from BATCH_QUERIES (defaults to a quick summary)
 
-        self.ser.reset_input_buffer()
-        self.ser.reset_output_buffer()
+        When two or more SYSTEM_INFO_FIELDS are requested they are read from
+        the single composite '150 1' reply; any it does not supply are then
+        queried individually.
 
-        # Add CR terminator
-        cmd_full = f"~{self.device_id}{command}\r"
-        self.ser.write(cmd_full.encode('ascii'))
-        self.ser.flush()
+        Returns:
+            Dictionary keyed by query name (e.g. 'temperature': int,
+            'fans': dict, 'volume': int, 'system_info': dict)
+        """
+        fields = list(fields)
+        folded = [name for name in fields if name in self.SYSTEM_INFO_FIELDS]
+        if len(folded) < 2:
+            return self.batch_query(fields)
 
-        # Read response
-        response = b''
-        for _ in range(10):
-            time.sleep(0.1)
-            if self.ser.in_waiting > 0:
-                response += self.ser.read(self.ser.in_waiting)
-                if b'Ok' in response or b'P' in response or b'F' in response:
-                    break
+        names = [name for name in fields if name not in self.SYSTEM_INFO_FIELDS]
+        if 'system_info' not in names:
+            names.append('system_info')
+        status = self._batch_query(names, tuple(folded))
+        if folded[0] not in status:
+            status.update(self.batch_query(folded))
 
-        return response.decode('ascii', errors='ignore').strip()
+        return {name: status[name] for name in fields}
+
+    def get_all_status(self) -> Dict[str, Any]:
+        """Read every status value in a single round-trip (see get_status_bundle)"""
+        return self.get_status_bundle(self.BATCH_QUERIES)
 
     def _check_success(self, response: str) -> bool:
         """Check if command was successful"""
         return response == 'P' or response.startswith('Ok')
 
+    def _set_from_table(self, table: Dict[str, str], name: str) -> bool:
+        """
+        Send the command a settings table maps name to
+
+        Args:
+            table: One of SOURCES, PROJECTION_MODES, DISPLAY_MODES, COLOR_TEMPS, ASPECT_RATIOS
+            name: Table key (case-insensitive)
+
+        Returns:
+            True if name is known and the command succeeded
+        """
+        command = table.get(str(name).lower())
+        return command is not None and self._check_success(self._send_command(command))
+
+    def apply_settings(self, source: Optional[str] = None, display_mode: Optional[str] = None,
+                       aspect: Optional[str] = None, brightness: Optional[int] = None,
+                       contrast: Optional[int] = None,
+                       color_temp: Optional[str] = None) -> Dict[str, bool]:
+        """
+        Apply several settings with a single write
+
+        All command frames are sent back-to-back and the acknowledgements
+        drained in one read. Settings left as None are not touched.
+
+        Args:
+            source: Key of SOURCES (e.g. 'hdmi')
+            display_mode: Key of DISPLAY_MODES (e.g. 'presentation')
+            aspect: Key of ASPECT_RATIOS (e.g. '16:9')
+            brightness: Brightness 0-10
+            contrast: Contrast 0-10
+            color_temp: Key of COLOR_TEMPS (e.g. 'warm')
+
+        Returns:
+            Dictionary mapping each requested setting to True/False
+        """
+        results = {}
+        pending = {}
+
+        for name, value, table in [('source', source, self.SOURCES),
+                                   ('display_mode', display_mode, self.DISPLAY_MODES),
+                                   ('aspect', aspect, self.ASPECT_RATIOS),
+                                   ('color_temp', color_temp, self.COLOR_TEMPS)]:
+            if value is None:
+                continue
+            command = table.get(str(value).lower())
+            if command:
+                pending[name] = command
+            else:
+                results[name] = False
+
+        for name, value, command in [('brightness', brightness, '21'),
+                                     ('contrast', contrast, '22')]:
+            if value is None:
+                continue
+            if 0 <= value <= 10:
+                pending[name] = f'{command} {value}'
+            else:
+                results[name] = False
+
+        replies = self.send_batch(list(pending.values()))
+        for name, reply in zip(pending, replies):
+            results[name] = self._check_success(reply)
+
+        return results
+
     # ========== POWER CONTROL ==========
 
     def power_on(self) -> bool:
@@ -109,12 +924,7 @@ class ProjectorController:
 
     def get_power_state(self) -> Optional[bool]:
         """Get power state. Returns True if on, False if off"""
-        response = self._send_command('124 1')
-        if response == 'Ok0':
-            return False
-        elif response == 'Ok1':
-            return True
-        return None
+        return parse_bool(self._send_command('124 1'))
 
     # ========== MUTE CONTROL ==========
 
@@ -130,12 +940,7 @@ class ProjectorController:
 
     def get_av_mute_state(self) -> Optional[bool]:
         """Get AV mute state"""
-        response = self._send_command('355 1')
-        if response == 'Ok0':
-            return False
-        elif response == 'Ok1':
-            return True
-        return None
+        return parse_bool(self._send_command('355 1'))
 
     def audio_mute_on(self) -> bool:
         """Turn on audio mute"""
@@ -149,12 +954,7 @@ class ProjectorController:
 
     def get_audio_mute_state(self) -> Optional[bool]:
         """Get audio mute state"""
-        response = self._send_command('356 1')
-        if response == 'Ok0':
-            return False
-        elif response == 'Ok1':
-            return True
-        return None
+        return parse_bool(self._send_command('356 1'))
 
     # ========== FREEZE CONTROL ==========
 
@@ -170,156 +970,59 @@ class ProjectorController:
 
     # ========== SOURCE CONTROL ==========
 
-    def set_source_hdmi(self) -> bool:
-        """Switch to HDMI input"""
-        response = self._send_command('12 1')
-        return self._check_success(response)
+    def set_source(self, name: str) -> bool:
+        """Switch input source by SOURCES key ('hdmi', 'usb', 'sd_card', 'android_home')"""
+        return self._set_from_table(self.SOURCES, name)
 
-    def set_source_usb(self) -> bool:
-        """Switch to USB-A (Flash Drive)"""
-        response = self._send_command('12 17')
-        return self._check_success(response)
-
-    def set_source_sd_card(self) -> bool:
-        """Switch to SD Card"""
-        response = self._send_command('12 31')
-        return self._check_success(response)
-
-    def set_source_android_home(self) -> bool:
-        """Switch to Android Home page (Smart TV)"""
-        response = self._send_command('12 24')
-        return self._check_success(response)
+    # Fixed-value shortcuts
+    set_source_hdmi = functools.partialmethod(set_source, 'hdmi')
+    set_source_usb = functools.partialmethod(set_source, 'usb')
+    set_source_sd_card = functools.partialmethod(set_source, 'sd_card')
+    set_source_android_home = functools.partialmethod(set_source, 'android_home')
 
     def get_input_source(self) -> Optional[str]:
         """Get current input source"""
-        response = self._send_command('121 1')
-        if response.startswith('Ok'):
-            code = response[2:]
-            source_map = {
-                '7': 'HDMI 1',
-                '20': 'Android Home (USB-A/SD Card)'
-            }
-            return source_map.get(code, f"Unknown ({code})")
-        return None
+        return parse_code(self._send_command('121 1'), _SOURCE_NAMES)
 
     # ========== PROJECTION MODE ==========
 
-    def set_projection_front_desktop(self) -> bool:
-        """Set projection mode: Front-Desktop"""
-        response = self._send_command('71 1')
-        return self._check_success(response)
-
-    def set_projection_rear_desktop(self) -> bool:
-        """Set projection mode: Rear-Desktop"""
-        response = self._send_command('71 2')
-        return self._check_success(response)
-
-    def set_projection_front_ceiling(self) -> bool:
-        """Set projection mode: Front-Ceiling"""
-        response = self._send_command('71 3')
-        return self._check_success(response)
+    def set_projection(self, name: str) -> bool:
+        """Set projection mode by PROJECTION_MODES key (e.g. 'front_ceiling')"""
+        return self._set_from_table(self.PROJECTION_MODES, name)
 
-    def set_projection_rear_ceiling(self) -> bool:
-        """Set projection mode: Rear-Ceiling"""
-        response = self._send_command('71 4')
-        return self._check_success(response)
+    # Fixed-value shortcuts
+    set_projection_front_desktop = functools.partialmethod(set_projection, 'front_desktop')
+    set_projection_rear_desktop = functools.partialmethod(set_projection, 'rear_desktop')
+    set_projection_front_ceiling = functools.partialmethod(set_projection, 'front_ceiling')
+    set_projection_rear_ceiling = functools.partialmethod(set_projection, 'rear_ceiling')
 
     def get_projection_mode(self) -> Optional[str]:
         """Get projection mode"""
-        response = self._send_command('129 1')
-        if response.startswith('Ok'):
-            mode_map = {
-                '0': 'Front-Desktop',
-                '1': 'Rear-Desktop',
-                '2': 'Front-Ceiling',
-                '3': 'Rear-Ceiling'
-            }
-            return mode_map.get(response[2], 'Unknown')
-        return None
+        return parse_code(self._send_command('129 1'), _PROJECTION_NAMES, 'Unknown')
 
     # ========== DISPLAY MODE (PICTURE MODE) ==========
 
-    def set_display_mode_presentation(self) -> bool:
-        """Set display mode: Presentation (PC)"""
-        response = self._send_command('20 1')
-        return self._check_success(response)
-
-    def set_display_mode_bright(self) -> bool:
-        """Set display mode: Bright"""
-        response = self._send_command('20 2')
-        return self._check_success(response)
-
-    def set_display_mode_cinema(self) -> bool:
-        """Set display mode: Cinema"""
-        response = self._send_command('20 3')
-        return self._check_success(response)
-
-    def set_display_mode_srgb(self) -> bool:
-        """Set display mode: sRGB"""
-        response = self._send_command('20 4')
-        return self._check_success(response)
-
-    def set_display_mode_photo(self) -> bool:
-        """Set display mode: Photo (Vivid)"""
-        response = self._send_command('20 16')
-        return self._check_success(response)
-
-    def set_display_mode_eco(self) -> bool:
-        """Set display mode: Eco"""
-        response = self._send_command('20 44')
-        return self._check_success(response)
-
-    def set_display_mode_3d(self) -> bool:
-        """Set display mode: 3D"""
-        response = self._send_command('20 9')
-        return self._check_success(response)
-
-    def set_display_mode_game(self) -> bool:
-        """Set display mode: Game"""
-        response = self._send_command('20 12')
-        return self._check_success(response)
-
-    def set_display_mode_hdr(self) -> bool:
-        """Set display mode: HDR"""
-        response = self._send_command('20 21')
-        return self._check_success(response)
-
-    def set_display_mode_hlg(self) -> bool:
-        """Set display mode: HLG"""
-        response = self._send_command('20 25')
-        return self._check_success(response)
-
-    def set_display_mode_ai_pq(self) -> bool:
-        """Set display mode: AI-PQ"""
-        response = self._send_command('20 41')
-        return self._check_success(response)
-
-    def set_display_mode_wcg(self) -> bool:
-        """Set display mode: WCG (Wide Color Gamut)"""
-        response = self._send_command('20 42')
-        return self._check_success(response)
+    def set_display_mode(self, name: str) -> bool:
+        """Set display mode by DISPLAY_MODES key (e.g. 'cinema')"""
+        return self._set_from_table(self.DISPLAY_MODES, name)
+
+    # Fixed-value shortcuts
+    set_display_mode_presentation = functools.partialmethod(set_display_mode, 'presentation')
+    set_display_mode_bright = functools.partialmethod(set_display_mode, 'bright')
+    set_display_mode_cinema = functools.partialmethod(set_display_mode, 'cinema')
+    set_display_mode_srgb = functools.partialmethod(set_display_mode, 'srgb')
+    set_display_mode_photo = functools.partialmethod(set_display_mode, 'photo')
+    set_display_mode_eco = functools.partialmethod(set_display_mode, 'eco')
+    set_display_mode_3d = functools.partialmethod(set_display_mode, '3d')
+    set_display_mode_game = functools.partialmethod(set_display_mode, 'game')
+    set_display_mode_hdr = functools.partialmethod(set_display_mode, 'hdr')
+    set_display_mode_hlg = functools.partialmethod(set_display_mode, 'hlg')
+    set_display_mode_ai_pq = functools.partialmethod(set_display_mode, 'ai_pq')
+    set_display_mode_wcg = functools.partialmethod(set_display_mode, 'wcg')
 
     def get_display_mode(self) -> Optional[str]:
         """Get current display mode"""
-        response = self._send_command('123 1')
-        if response.startswith('Ok'):
-            mode_map = {
-                '1': 'Presentation (PC)',
-                '2': 'Bright',
-                '3': 'Cinema',
-                '4': 'sRGB',
-                '9': '3D',
-                '12': 'Game',
-                '14': 'Photo (Vivid)',
-                '21': 'HDR',
-                '25': 'HLG',
-                '41': 'AI-PQ',
-                '42': 'WCG',
-                '43': 'Eco'
-            }
-            code = response[2:]
-            return mode_map.get(code, f"Unknown ({code})")
-        return None
+        return parse_code(self._send_command('123 1'), _DISPLAY_MODE_NAMES)
 
     # ========== IMAGE SETTINGS ==========
 
@@ -332,13 +1035,7 @@ class ProjectorController:
 
     def get_brightness(self) -> Optional[int]:
         """Get brightness value (0-10)"""
-        response = self._send_command('125 1')
-        if response.startswith('Ok'):
-            try:
-                return int(response[2:])
-            except:
-                pass
-        return None
+        return parse_int(self._send_command('125 1'))
 
     def set_contrast(self, value: int) -> bool:
         """Set contrast (0-10)"""
@@ -349,77 +1046,38 @@ class ProjectorController:
 
     def get_contrast(self) -> Optional[int]:
         """Get contrast value (0-10)"""
-        response = self._send_command('126 1')
-        if response.startswith('Ok'):
-            try:
-                return int(response[2:])
-            except:
-                pass
-        return None
+        return parse_int(self._send_command('126 1'))
 
     # ========== COLOR TEMPERATURE ==========
 
-    def set_color_temp_standard(self) -> bool:
-        """Set color temperature: Standard (D75)"""
-        response = self._send_command('36 1')
-        return self._check_success(response)
-
-    def set_color_temp_cold(self) -> bool:
-        """Set color temperature: Cold (D83)"""
-        response = self._send_command('36 3')
-        return self._check_success(response)
+    def set_color_temp(self, name: str) -> bool:
+        """Set color temperature by COLOR_TEMPS key ('standard', 'cold', 'warm')"""
+        return self._set_from_table(self.COLOR_TEMPS, name)
 
-    def set_color_temp_warm(self) -> bool:
-        """Set color temperature: Warm (D65)"""
-        response = self._send_command('36 4')
-        return self._check_success(response)
+    # Fixed-value shortcuts
+    set_color_temp_standard = functools.partialmethod(set_color_temp, 'standard')
+    set_color_temp_cold = functools.partialmethod(set_color_temp, 'cold')
+    set_color_temp_warm = functools.partialmethod(set_color_temp, 'warm')
 
     def get_color_temperature(self) -> Optional[str]:
         """Get color temperature setting"""
-        response = self._send_command('128 1')
-        if response.startswith('Ok'):
-            temp_map = {
-                '2': 'Standard (D75)',
-                '3': 'Warm (D65)',
-                '5': 'Cold (D83)'
-            }
-            return temp_map.get(response[2], 'Unknown')
-        return None
+        return parse_code(self._send_command('128 1'), _COLOR_TEMP_NAMES, 'Unknown')
 
     # ========== ASPECT RATIO ==========
 
-    def set_aspect_4_3(self) -> bool:
-        """Set aspect ratio: 4:3"""
-        response = self._send_command('60 1')
-        return self._check_success(response)
+    def set_aspect(self, name: str) -> bool:
+        """Set aspect ratio by ASPECT_RATIOS key ('4:3', '16:9', '16:10', 'auto')"""
+        return self._set_from_table(self.ASPECT_RATIOS, name)
 
-    def set_aspect_16_9(self) -> bool:
-        """Set aspect ratio: 16:9"""
-        response = self._send_command('60 2')
-        return self._check_success(response)
-
-    def set_aspect_16_10(self) -> bool:
-        """Set aspect ratio: 16:10"""
-        response = self._send_command('60 3')
-        return self._check_success(response)
-
-    def set_aspect_auto(self) -> bool:
-        """Set aspect ratio: Auto"""
-        response = self._send_command('60 7')
-        return self._check_success(response)
+    # Fixed-value shortcuts
+    set_aspect_4_3 = functools.partialmethod(set_aspect, '4:3')
+    set_aspect_16_9 = functools.partialmethod(set_aspect, '16:9')
+    set_aspect_16_10 = functools.partialmethod(set_aspect, '16:10')
+    set_aspect_auto = functools.partialmethod(set_aspect, 'auto')
 
     def get_aspect_ratio(self) -> Optional[str]:
         """Get aspect ratio setting"""
-        response = self._send_command('127 1')
-        if response.startswith('Ok'):
-            ratio_map = {
-                '1': '4:3',
-                '2': '16:9',
-                '3': '16:10',
-                '7': 'Auto'
-            }
-            return ratio_map.get(response[2:], 'Unknown')
-        return None
+        return parse_code(self._send_command('127 1'), _ASPECT_NAMES, 'Unknown')
 
     # ========== KEYSTONE ==========
 
@@ -435,13 +1093,7 @@ class ProjectorController:
 
     def get_v_keystone(self) -> Optional[int]:
         """Get vertical keystone value (-40 to +40)"""
-        response = self._send_command('543 3')
-        if response.startswith('Ok'):
-            try:
-                return int(response[2:])
-            except:
-                pass
-        return None
+        return parse_int(self._send_command('543 3'))
 
     # ========== DIGITAL ZOOM ==========
 
@@ -455,49 +1107,18 @@ class ProjectorController:
         response = self._send_command(f'62 {level}')
         return self._check_success(response)
 
-    def set_digital_zoom_50(self) -> bool:
-        """Set digital zoom to 50%"""
-        return self.set_digital_zoom(0)
-
-    def set_digital_zoom_75(self) -> bool:
-        """Set digital zoom to 75%"""
-        return self.set_digital_zoom(1)
-
-    def set_digital_zoom_100(self) -> bool:
-        """Set digital zoom to 100% (normal)"""
-        return self.set_digital_zoom(2)
-
-    def set_digital_zoom_125(self) -> bool:
-        """Set digital zoom to 125%"""
-        return self.set_digital_zoom(3)
-
-    def set_digital_zoom_150(self) -> bool:
-        """Set digital zoom to 150%"""
-        return self.set_digital_zoom(4)
-
-    def set_digital_zoom_175(self) -> bool:
-        """Set digital zoom to 175%"""
-        return self.set_digital_zoom(5)
-
-    def set_digital_zoom_200(self) -> bool:
-        """Set digital zoom to 200%"""
-        return self.set_digital_zoom(6)
+    # Fixed-value shortcuts
+    set_digital_zoom_50 = functools.partialmethod(set_digital_zoom, 0)
+    set_digital_zoom_75 = functools.partialmethod(set_digital_zoom, 1)
+    set_digital_zoom_100 = functools.partialmethod(set_digital_zoom, 2)
+    set_digital_zoom_125 = functools.partialmethod(set_digital_zoom, 3)
+    set_digital_zoom_150 = functools.partialmethod(set_digital_zoom, 4)
+    set_digital_zoom_175 = functools.partialmethod(set_digital_zoom, 5)
+    set_digital_zoom_200 = functools.partialmethod(set_digital_zoom, 6)
 
     def get_digital_zoom(self) -> Optional[str]:
         """Get digital zoom level"""
-        response = self._send_command('543 9')
-        if response.startswith('Ok'):
-            zoom_map = {
-                '0': '50%',
-                '1': '75%',
-                '2': '100%',
-                '3': '125%',
-                '4': '150%',
-                '5': '175%',
-                '6': '200%'
-            }
-            return zoom_map.get(response[2], 'Unknown')
-        return None
+        return parse_code(self._send_command('543 9'), _ZOOM_NAMES, 'Unknown')
 
     # ========== VOLUME ==========
 
@@ -511,15 +1132,25 @@ class ProjectorController:
         response = self._send_command('140 17')
         return self._check_success(response)
 
+    def volume_step(self, delta: int) -> bool:
+        """
+        Move volume by delta steps, sending all key presses in one write
+
+        The protocol has no absolute volume command, only Volume +/-.
+
+        Args:
+            delta: Steps to move (positive = up, negative = down)
+
+        Returns:
+            True if every step was acknowledged
+        """
+        command = '140 18' if delta > 0 else '140 17'
+        responses = self.send_batch([command] * abs(delta))
+        return all(self._check_success(response) for response in responses)
+
     def get_volume(self) -> Optional[int]:
         """Get volume level (0-10)"""
-        response = self._send_command('120 1')
-        if response.startswith('Ok'):
-            try:
-                return int(response[2:])
-            except:
-                pass
-        return None
+        return parse_int(self._send_command('120 1'))
 
     # ========== LANGUAGE ==========
 
@@ -534,35 +1165,41 @@ class ProjectorController:
 
     # ========== REMOTE CONTROL FUNCTIONS ==========
 
-    def remote_menu(self) -> bool:
-        """Display OSD main menu"""
-        response = self._send_command('140 20')
-        return self._check_success(response)
+    def remote_press(self, key: str, repeat: int = 1) -> bool:
+        """
+        Press a remote/OSD key, sending repeats in one write
 
-    def remote_up(self) -> bool:
-        """OSD menu - Up"""
-        response = self._send_command('140 10')
-        return self._check_success(response)
+        With remote_min_interval set (e.g. 0.05 for a UI's key repeat), a
+        press arriving sooner than that after the previous one is dropped,
+        so a held arrow key cannot queue up more presses than the projector
+        acknowledges.
 
-    def remote_down(self) -> bool:
-        """OSD menu - Down"""
-        response = self._send_command('140 14')
-        return self._check_success(response)
+        Args:
+            key: One of REMOTE_KEYS (menu, up, down, left, right, enter)
+            repeat: Number of presses
 
-    def remote_left(self) -> bool:
-        """OSD menu - Left"""
-        response = self._send_command('140 11')
-        return self._check_success(response)
+        Returns:
+            True if every press was acknowledged (or the press was dropped)
+        """
+        command = self.REMOTE_KEYS.get(str(key).lower())
+        if command is None or repeat < 1:
+            return False
 
-    def remote_right(self) -> bool:
-        """OSD menu - Right"""
-        response = self._send_command('140 13')
-        return self._check_success(response)
+        now = time.monotonic()
+        if now - self._last_remote < self.remote_min_interval:
+            return True
+        self._last_remote = now
 
-    def remote_enter(self) -> bool:
-        """OSD menu - Enter"""
-        response = self._send_command('140 12')
-        return self._check_success(response)
+        responses = self.send_batch([command] * repeat)
+        return all(self._check_success(response) for response in responses)
+
+    # Single-press shortcuts
+    remote_menu = functools.partialmethod(remote_press, 'menu')
+    remote_up = functools.partialmethod(remote_press, 'up')
+    remote_down = functools.partialmethod(remote_press, 'down')
+    remote_left = functools.partialmethod(remote_press, 'left')
+    remote_right = functools.partialmethod(remote_press, 'right')
+    remote_enter = functools.partialmethod(remote_press, 'enter')
 
     # ========== SYSTEM INFORMATION ==========
 
@@ -571,169 +1208,114 @@ class ProjectorController:
         response = self._send_command('150 1')
 
         info = {}
-        if response.startswith('Ok') and len(response) >= 15:
-            data = response[2:]
-
-            # Parse: Okabbbbbccddddee
-            info['power'] = 'On' if data[0] == '1' else 'Off'
-            info['lamp_hours'] = int(data[1:6])
-
-            source_code = data[6:8]
-            source_map = {
-                '07': 'HDMI 1',
-                '20': 'Android Home (USB-A/SD Card)'
-            }
-            info['input_source'] = source_map.get(source_code, f"Unknown ({source_code})")
-
-            info['firmware'] = data[8:12]
-
-            if len(data) >= 14:
-                mode_code = data[12:14]
-                mode_map = {
-                    '01': 'Presentation (PC)',
-                    '02': 'Bright',
-                    '03': 'Cinema',
-                    '04': 'sRGB',
-                    '14': 'Photo (Vivid)',
-                    '28': 'Eco'
-                }
-                info['picture_mode'] = mode_map.get(mode_code, f"Unknown ({mode_code})")
+        match = _SYSTEM_INFO_RE.match(response)
+        if match:
+            info['power'] = 'On' if match['power'] == '1' else 'Off'
+            info['lamp_hours'] = int(match['lamp_hours'])
+
+            source_code = match['source']
+            info['input_source'] = _SOURCE_NAMES.get(source_code.lstrip('0'), f"Unknown ({source_code})")
+
+            info['firmware'] = match['firmware']
+
+            mode_code = match['mode']
+            if mode_code:
+                info['picture_mode'] = _SYSTEM_MODE_NAMES.get(mode_code, f"Unknown ({mode_code})")
 
         return info
 
+    @_cached()
     def get_software_version(self) -> Dict[str, str]:
         """Get detailed software version information (all versions)"""
         response = self._send_command('122 1')
 
         versions = {}
         if response.startswith('Ok'):
-            # Parse: OkAaaMbbLccHddSeeXff or OkCaaMbbRcc format
-            data = response[2:]
-
-            # Try to parse the format
-            if 'C' in data and 'M' in data:
-                parts = data.replace('R', 'R ').replace('M', ' M').replace('L', ' L').replace('H', ' H').replace('S', ' S').replace('X', ' X').split()
-                for part in parts:
-                    if part.startswith('C'):
-                        versions['DDP'] = part[1:]
-                    elif part.startswith('M'):
-                        versions['MCU'] = part[1:]
-                    elif part.startswith('R'):
-                        versions['Android'] = part[1:]
-                    elif part.startswith('L'):
-                        versions['LAN'] = part[1:]
-                    elif part.startswith('H'):
-                        versions['HDBaseT'] = part[1:]
-                    elif part.startswith('S'):
-                        versions['System'] = part[1:]
+            for tag, version in _VERSION_RE.findall(response, 2):
+                if tag in _VERSION_TAGS:
+                    versions[_VERSION_TAGS[tag]] = version
 
         return versions
 
+    @_cached()
     def get_ddp_software_version(self) -> Optional[str]:
         """Get DDP software version only"""
-        response = self._send_command('357 3')
-        if response.startswith('Ok'):
-            return response[2:]
-        return None
+        return parse_text(self._send_command('357 3'))
 
+    @_cached()
     def get_android_software_version(self) -> Optional[str]:
         """Get Android software version only"""
-        response = self._send_command('357 4')
-        if response.startswith('Ok'):
-            return response[2:]
-        return None
+        return parse_text(self._send_command('357 4'))
 
+    @_cached(ttl=30.0)
     def get_lamp_hours(self) -> Optional[int]:
         """Get light source hours of usage"""
-        response = self._send_command('108 1')
-        if response.startswith('Ok'):
-            try:
-                return int(response[2:])
-            except:
-                pass
-        return None
+        return parse_int(self._send_command('108 1'))
 
+    @_cached(ttl=30.0)
     def get_system_hours(self) -> Optional[int]:
         """Get total system hours of usage"""
-        response = self._send_command('150 21')
-        if response.startswith('Ok'):
-            try:
-                return int(response[2:])
-            except:
-                pass
-        return None
+        return parse_int(self._send_command('150 21'))
 
+    @_cached(ttl=2.0)
     def get_temperature(self) -> Optional[int]:
         """Get system temperature"""
-        response = self._send_command('352 1')
-        if response.startswith('Ok'):
-            try:
-                return int(response[2:])
-            except:
-                pass
-        return None
+        return parse_int(self._send_command('352 1'))
 
+    @_cached(ttl=2.0)
     def get_fan_speeds(self) -> Dict[str, Optional[int]]:
-        """Get all fan speeds in RPM"""
-        fans = {}
+        """Get all fan speeds in RPM (the per-fan queries share one write)"""
+        commands = [f'351 {fan_num}' for fan_num, _ in self.FANS]
+        responses = self.send_batch(commands)
 
-        for fan_num, fan_name in [(0, 'System Fan 1'), (1, 'System Fan 2'), (2, 'Optical Fan')]:
-            response = self._send_command(f'351 {fan_num}')
-            if response.startswith('Ok'):
-                try:
-                    fans[fan_name] = int(response[2:])
-                except:
-                    fans[fan_name] = None
-            else:
-                fans[fan_name] = None
-
-        return fans
+        # Re-query individually any fan the batched read missed
+        return {fan_name: parse_int(response or self._send_command(command))
+                for (_, fan_name), command, response in zip(self.FANS, commands, responses)}
 
+    @_cached()
     def get_mac_address(self) -> Optional[str]:
         """Get network MAC address"""
-        response = self._send_command('555 2')
-        if response.startswith('Ok'):
-            return response[2:]
-        return None
+        return parse_text(self._send_command('555 2'))
 
+    @_cached()
     def get_device_id(self) -> Optional[str]:
         """Get projector device ID (00-99)"""
-        response = self._send_command('558 1')
-        if response.startswith('Ok'):
-            return response[2:]
-        return None
+        return parse_text(self._send_command('558 1'))
 
     def get_network_status(self) -> Optional[bool]:
         """Get WiFi connection status. Returns True if connected"""
-        response = self._send_command('451 1')
-        if response == 'Ok0':
-            return False
-        elif response == 'Ok1':
-            return True
-        return None
+        return parse_bool(self._send_command('451 1'))
 
     def get_signal_status(self) -> Optional[bool]:
         """Get signal status of current input. Returns True if signal active"""
-        response = self._send_command('150 23')
-        if response == 'Ok0':
-            return False
-        elif response == 'Ok1':
-            return True
-        return None
+        return parse_bool(self._send_command('150 23'))
+
+    def wait_for_signal(self, timeout: float = 2.5, interval: float = 0.1) -> bool:
+        """
+        Poll signal status until the current input reports an active signal
+
+        Args:
+            timeout: Seconds to keep polling
+            interval: Seconds between polls
+
+        Returns:
+            True as soon as a signal is detected, False on timeout
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            if self.get_signal_status():
+                return True
+            if time.monotonic() + interval >= deadline:
+                return False
+            time.sleep(interval)
 
     def get_resolution(self) -> Optional[str]:
         """Get source resolution"""
-        response = self._send_command('150 4')
-        if response.startswith('Ok'):
-            return response[2:]
-        return None
+        return parse_text(self._send_command('150 4'))
 
     def get_refresh_rate(self) -> Optional[str]:
         """Get refresh rate"""
-        response = self._send_command('150 19')
-        if response.startswith('Ok'):
-            return response[2:]
-        return None
+        return parse_text(self._send_command('150 19'))
 
     # ========== DIGITAL SIGNAGE ==========
 
@@ -749,29 +1331,27 @@ class ProjectorController:
 
     def get_digital_signage_status(self) -> Optional[bool]:
         """Get digital signage status"""
-        response = self._send_command('568 1')
-        if response == 'Ok0':
-            return False
-        elif response == 'Ok1':
-            return True
-        return None
+        return parse_bool(self._send_command('568 1'))
 
     # ========== RESET FUNCTIONS ==========
 
     def factory_reset(self) -> bool:
         """Perform factory reset (WARNING: Resets all settings)"""
         response = self._send_command('112 1')
+        self._cache.clear()
         return self._check_success(response)
 
     def reset_osd_settings(self) -> bool:
         """Reset OSD settings to default"""
         response = self._send_command('546 1')
+        self._cache.clear()
         return self._check_success(response)
 
     # ========== CONTEXT MANAGER SUPPORT ==========
 
     def __enter__(self):
-        """Context manager entry"""
+        """Context manager entry (starts a new session with an empty cache)"""
+        self._cache.clear()
         self.connect()
         return self
 
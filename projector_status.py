@@ -2,9 +2,15 @@
 """
 Projector RS232 Control Script
 Connects to projector on COM10 and queries status
+
+Framing: commands are '~<id><command>\r' and every reply (Ok<data>, P or F)
+ends in a single CR, so a reply is complete exactly when its CR has arrived.
+New commands must keep to this; the reads below rely on it.
 """
 
 import serial
+import struct
+import sys
 import time
 
 # Serial port configuration
@@ -18,89 +24,171 @@ XONXOFF = False
 RTSCTS = False
 DSRDTR = False
 
-def send_command(ser, command):
-    """Send a command to the projector and return response"""
-    # Clear any existing data in buffer
-    ser.reset_input_buffer()
-    ser.reset_output_buffer()
-
-    # Add CR terminator if not present
-    if not command.endswith('\r'):
-        command += '\r'
-
-    # Send command
-    cmd_bytes = command.encode('ascii')
-    print(f"Sending: {repr(command)} | Hex: {cmd_bytes.hex(' ')}")
+# Print every frame sent and received (python projector_status.py --debug)
+DEBUG = False
+
+# Encoded frames for the queries this script sends
+COMMANDS = {
+    'system_info': b'~00150 1\r',
+    'power': b'~00124 1\r',
+    'input_source': b'~00121 1\r',
+    'software_version': b'~00122 1\r',
+}
+
+# Queries sent by get_projector_status, in reply order
+STATUS_QUERIES = ['system_info', 'power', 'input_source', 'software_version']
+
+# Last status read by get_projector_status, for callers polling with ttl_s
+_STATUS_CACHE = {'fetched_at': 0.0, 'value': None}
+
+# '150 1' input source and picture mode codes
+SOURCE_MAP = {
+    b'07': 'HDMI 1',
+    b'20': 'Android (USB-A/SD Card/Home)'
+}
+
+MODE_MAP = {
+    b'01': 'Presentation (PC)',
+    b'02': 'Bright',
+    b'03': 'Cinema',
+    b'04': 'sRGB',
+    b'14': 'Photo (Vivid)',
+    b'28': 'Eco',
+    b'29': 'iDevice'
+}
+
+# '150 1' fields after 'Ok': power, lamp hours, source, firmware (picture mode follows)
+SYSINFO = struct.Struct('1s5s2s4s')
+
+def enable_low_latency(ser):
+    """Ask the driver not to hold short replies for the USB latency timer (ignored if unsupported)"""
+    try:
+        ser.set_low_latency_mode(True)
+    except (AttributeError, NotImplementedError, ValueError, OSError):
+        pass
+
+def encode_command(command):
+    """Return the frame for a COMMANDS key or a raw command string"""
+    cmd_bytes = COMMANDS.get(command)
+    if cmd_bytes is None:
+        # Add CR terminator if not present
+        if not command.endswith('\r'):
+            command += '\r'
+        cmd_bytes = command.encode('ascii')
+    return cmd_bytes
+
+def send_commands_pipelined(ser, commands):
+    """Send several commands in one write and return their raw responses (without CR) in order"""
+    # Send all commands back-to-back
+    cmd_bytes = b''.join(encode_command(command) for command in commands)
+    if DEBUG:
+        print(f"Sending: {repr(cmd_bytes.decode('ascii'))} | Hex: {cmd_bytes.hex(' ')}")
     ser.write(cmd_bytes)
     ser.flush()
 
-    # Wait for response with multiple attempts
-    response = b''
-    max_attempts = 10
-    for i in range(max_attempts):
-        time.sleep(0.1)
-        waiting = ser.in_waiting
-        if waiting > 0:
-            response += ser.read(waiting)
-            print(f"  Read {waiting} bytes: {repr(response)}")
-            # If we got 'Ok' or 'P' or 'F', likely complete
-            if b'Ok' in response or b'P' in response or b'F' in response:
-                break
-        else:
-            if response:
-                break  # Got some data, no more coming
-
-    print(f"Received: {repr(response)} | Hex: {response.hex(' ') if response else 'empty'}")
+    # Replies come back in order, each ending in CR; broadcast lines (e.g. INFOn)
+    # may arrive in between and are skipped rather than taken as replies
+    responses = []
+    deadline = time.monotonic() + TIMEOUT * len(commands)
+    while len(responses) < len(commands) and time.monotonic() < deadline:
+        response = ser.read_until(b'\r', size=64)
+        if DEBUG:
+            print(f"Received: {repr(response)} | Hex: {response.hex(' ') if response else 'empty'}")
+        if response.strip().startswith((b'Ok', b'P', b'F')):
+            responses.append(response.strip())
+        if not response.endswith(b'\r'):
+            break  # Timed out before the CR; later replies are not coming either
+
+    return responses + [b''] * (len(commands) - len(responses))
 
-    return response.decode('ascii', errors='ignore').strip()
+def send_command(ser, command):
+    """Send a command (a COMMANDS key or a raw command string) and return response"""
+    return send_commands_pipelined(ser, [command])[0].decode('ascii', errors='ignore')
 
 def parse_system_info(response):
-    """Parse ~00150 1 response: Okabbbbbccddddee"""
-    if not response.startswith('Ok'):
+    """Parse raw ~00150 1 response bytes: Okabbbbbccddddee"""
+    if not response.startswith(b'Ok') or len(response) < 15:
         return None
 
-    data = response[2:]  # Remove 'Ok' prefix
-
-    if len(data) >= 13:
-        info = {
-            'power_status': 'On' if data[0] == '1' else 'Off',
-            'lamp_hours': data[1:6],
-            'input_source_code': data[6:8],
-            'firmware_version': data[8:12],
-            'picture_mode_code': data[12:14] if len(data) >= 14 else 'N/A'
-        }
-
-        # Decode input source
-        source_map = {
-            '07': 'HDMI 1',
-            '20': 'Android (USB-A/SD Card/Home)'
-        }
-        info['input_source'] = source_map.get(data[6:8], f"Unknown ({data[6:8]})")
-
-        # Decode picture mode
-        mode_map = {
-            '01': 'Presentation (PC)',
-            '02': 'Bright',
-            '03': 'Cinema',
-            '04': 'sRGB',
-            '14': 'Photo (Vivid)',
-            '28': 'Eco',
-            '29': 'iDevice'
-        }
-        info['picture_mode'] = mode_map.get(data[12:14], f"Unknown ({data[12:14]})")
-
-        return info
-
-    return None
-
-def get_projector_status():
-    """Connect to projector and get status"""
-    try:
-        # Open serial port
-        print(f"Opening {PORT} at {BAUDRATE} baud...")
-        ser = serial.Serial(
-            port=PORT,
-            baudrate=BAUDRATE,
+    power, hours, source, firmware = SYSINFO.unpack_from(response, 2)
+    mode = response[14:16]
+
+    return {
+        'power_status': 'On' if power == b'1' else 'Off',
+        'lamp_hours': hours.decode('ascii', errors='ignore'),
+        'input_source_code': source.decode('ascii', errors='ignore'),
+        'firmware_version': firmware.decode('ascii', errors='ignore'),
+        'picture_mode_code': mode.decode('ascii', errors='ignore') if len(mode) == 2 else 'N/A',
+        'input_source': SOURCE_MAP.get(source, f"Unknown ({source.decode('ascii', errors='ignore')})"),
+        'picture_mode': MODE_MAP.get(mode, f"Unknown ({mode.decode('ascii', errors='ignore')})"),
+    }
+
+def query_status(ser):
+    """Query system info, power, input source and software version in one write; returns raw replies"""
+    replies = send_commands_pipelined(ser, STATUS_QUERIES)
+    return dict(zip(STATUS_QUERIES, replies))
+
+def print_status(status):
+    """Print the replies returned by query_status"""
+    system_info = status['system_info']
+    power = status['power']
+    input_source = status['input_source']
+    software_version = status['software_version']
+
+    if system_info:
+        info = parse_system_info(system_info)
+        if info:
+            print("\n=== Projector Status ===")
+            print(f"Power Status:    {info['power_status']}")
+            print(f"Lamp Hours:      {info['lamp_hours']}")
+            print(f"Input Source:    {info['input_source']}")
+            print(f"Firmware Ver:    {info['firmware_version']}")
+            print(f"Picture Mode:    {info['picture_mode']}")
+        else:
+            print("Could not parse response")
+    else:
+        print("No response received")
+
+    print("\n=== Power State ===")
+    if power:
+        if power == b'Ok0':
+            print("Power: OFF")
+        elif power == b'Ok1':
+            print("Power: ON")
+        else:
+            print(f"Response: {power.decode('ascii', errors='ignore')}")
+
+    print("\n=== Input Source ===")
+    if input_source:
+        print(f"Input Source Response: {input_source.decode('ascii', errors='ignore')}")
+
+    print("\n=== Software Version ===")
+    if software_version:
+        print(f"Software Version: {software_version.decode('ascii', errors='ignore')}")
+
+class ProjectorSession:
+    """
+    Serial session that keeps the port open across status polls
+
+    Usage:
+        with ProjectorSession() as session:
+            status = session.status()
+    """
+
+    def __init__(self, port=None, baudrate=None):
+        """
+        Args:
+            port: Serial port name (default PORT)
+            baudrate: Baud rate (default BAUDRATE)
+        """
+        self.port = port or PORT
+        self.baudrate = baudrate or BAUDRATE
+        self.ser = None
+
+    def __enter__(self):
+        """Open the port with RTS/DTR raised"""
+        self.ser = serial.Serial(
+            baudrate=self.baudrate,
             bytesize=BYTESIZE,
             parity=PARITY,
             stopbits=STOPBITS,
@@ -109,77 +197,85 @@ def get_projector_status():
             rtscts=RTSCTS,
             dsrdtr=DSRDTR
         )
+        # Some devices need RTS/DTR signals; set before open() so they are applied while opening
+        self.ser.port = self.port
+        self.ser.rts = True
+        self.ser.dtr = True
+        self.ser.open()
+        enable_low_latency(self.ser)
+
+        # Discard line noise until the port has been quiet for 50 ms (200 ms at most)
+        self.ser.timeout = 0.05
+        deadline = time.monotonic() + 0.2
+        while time.monotonic() < deadline and self.ser.read(self.ser.in_waiting or 1):
+            pass
+        self.ser.timeout = TIMEOUT
+
+        # Start from empty buffers; commands do not purge them individually
+        self.ser.reset_input_buffer()
+        self.ser.reset_output_buffer()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Close the port"""
+        self.ser.close()
+
+    def status(self):
+        """Raw replies for STATUS_QUERIES (see query_status)"""
+        return query_status(self.ser)
+
+    def power(self):
+        """Power state: True (on), False (off) or None if unknown"""
+        return {'Ok1': True, 'Ok0': False}.get(send_command(self.ser, 'power'))
+
+    def input_source(self):
+        """Raw input source reply (e.g. 'Ok7')"""
+        return send_command(self.ser, 'input_source')
+
+def get_projector_status(ttl_s=0.0):
+    """
+    Connect to projector, print its status and return the raw replies
+
+    Args:
+        ttl_s: Reuse a status fetched less than this many seconds ago
+            without opening the port (default 0: always query)
+
+    Returns:
+        Dict of raw replies from query_status, or None on a port error
+    """
+    cached = _STATUS_CACHE['value']
+    if ttl_s > 0 and cached is not None and time.monotonic() - _STATUS_CACHE['fetched_at'] < ttl_s:
+        print_status(cached)
+        return cached
 
-        # Some devices need RTS/DTR signals
-        ser.setRTS(True)
-        ser.setDTR(True)
-        time.sleep(0.2)
-
-        print(f"Connected to {PORT}\n")
-
-        # Query comprehensive system information
-        print("=== Querying System Information ===")
-        response = send_command(ser, '~00150 1')
-
-        if response:
-            info = parse_system_info(response)
-            if info:
-                print("\n=== Projector Status ===")
-                print(f"Power Status:    {info['power_status']}")
-                print(f"Lamp Hours:      {info['lamp_hours']}")
-                print(f"Input Source:    {info['input_source']}")
-                print(f"Firmware Ver:    {info['firmware_version']}")
-                print(f"Picture Mode:    {info['picture_mode']}")
-            else:
-                print("Could not parse response")
-        else:
-            print("No response received")
-
-        print("\n=== Querying Power State ===")
-        response = send_command(ser, '~00124 1')
-        if response:
-            if response == 'Ok0':
-                print("Power: OFF")
-            elif response == 'Ok1':
-                print("Power: ON")
-            else:
-                print(f"Response: {response}")
-
-        print("\n=== Querying Input Source ===")
-        response = send_command(ser, '~00121 1')
-        if response:
-            print(f"Input Source Response: {response}")
+    try:
+        print(f"Opening {PORT} at {BAUDRATE} baud...")
+        with ProjectorSession() as session:
+            print(f"Connected to {PORT}\n")
 
-        print("\n=== Querying Software Version ===")
-        response = send_command(ser, '~00122 1')
-        if response:
-            print(f"Software Version: {response}")
+            # Send all four queries in one write
+            print("=== Querying Status ===")
+            status = session.status()
+            if any(status.values()):
+                _STATUS_CACHE['value'] = status
+                _STATUS_CACHE['fetched_at'] = time.monotonic()  # stamped after the query completes
+            print_status(status)
 
-        # Close serial port
-        ser.close()
         print("\nConnection closed.")
+        return status
 
     except serial.SerialException as e:
         print(f"Serial port error: {e}")
         print("\nTrying with 115200 baud...")
 
         try:
-            ser = serial.Serial(
-                port=PORT,
-                baudrate=115200,
-                bytesize=BYTESIZE,
-                parity=PARITY,
-                stopbits=STOPBITS,
-                timeout=TIMEOUT
-            )
-
-            print(f"Connected to {PORT} at 115200 baud\n")
-
-            print("=== Querying System Information ===")
-            response = send_command(ser, '~00150 1')
-            print(f"Response: {response}")
-
-            ser.close()
+            with ProjectorSession(baudrate=115200) as session:
+                print(f"Connected to {PORT} at 115200 baud\n")
+
+                print("=== Querying System Information ===")
+                response = send_command(session.ser, 'system_info')
+                print(f"Response: {response}")
+
             print("\nConnection closed.")
 
         except Exception as e2:
@@ -189,4 +285,5 @@ def get_projector_status():
         print(f"Error: {e}")
 
 if __name__ == "__main__":
+    DEBUG = '--debug' in sys.argv[1:]
     get_projector_status()
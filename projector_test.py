@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """
 Interactive Projector RS232 Test Tool
+
+Replies (Ok<data>, P or F) end in a single CR; each test reads up to it.
 """
 
 import serial
@@ -26,6 +28,12 @@ def test_connection():
             dsrdtr=False
         )
 
+        # USB-serial adapters otherwise hold short replies for up to 16 ms
+        try:
+            ser.set_low_latency_mode(True)
+        except (AttributeError, NotImplementedError, ValueError, OSError):
+            pass
+
         ser.setRTS(True)
         ser.setDTR(True)
         time.sleep(0.2)
@@ -50,20 +58,15 @@ def test_connection():
             cmd_full = cmd + '\r'
             cmd_bytes = cmd_full.encode('ascii')
             print(f"TX: {repr(cmd_full)}")
-            print(f"HEX: {' '.join(f'{b:02x}' for b in cmd_bytes)}")
+            print(f"HEX: {cmd_bytes.hex(' ')}")
 
             ser.write(cmd_bytes)
             ser.flush()
 
-            # Wait and read
-            time.sleep(1)
-            response = b''
-            for _ in range(20):
-                if ser.in_waiting > 0:
-                    chunk = ser.read(ser.in_waiting)
-                    response += chunk
-                    print(f"RX: {repr(chunk)} | HEX: {' '.join(f'{b:02x}' for b in chunk)}")
-                time.sleep(0.1)
+            # Replies end in CR: returns as soon as it arrives (or after the 2 s timeout)
+            response = ser.read_until(b'\r', size=64)
+            if response:
+                print(f"RX: {repr(response)} | HEX: {response.hex(' ')}")
 
             if not response:
                 print("No response")
@@ -72,12 +75,14 @@ def test_connection():
                 print(f"Decoded: {response.decode('ascii', errors='ignore')}")
 
         print("\n=== Listening for any data (5 seconds) ===")
-        start_time = time.time()
-        while time.time() - start_time < 5:
-            if ser.in_waiting > 0:
-                data = ser.read(ser.in_waiting)
+        # Each read blocks until data arrives (or 0.3 s pass), then takes the whole burst
+        ser.timeout = 0.3
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            data = ser.read(ser.in_waiting or 1)
+            if data:
+                data += ser.read(ser.in_waiting)
                 print(f"Received: {repr(data)} | {data.hex(' ')}")
-            time.sleep(0.1)
 
         ser.close()
         print("\nConnection closed.")
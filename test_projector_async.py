@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Tests for AsyncProjectorController's record-and-replay of sync getters
+
+Run with: python -m unittest test_projector_async
+"""
+
+import asyncio
+import unittest
+
+from projector_async import AsyncProjectorController
+
+
+class FakeWireTest(unittest.TestCase):
+    """Replaces _send_command so no serial port is needed"""
+
+    def setUp(self):
+        self.proj = AsyncProjectorController(port=None)
+        self.sent = []
+        self.replies = {'351 0': 'Ok1200', '351 1': 'Ok1300', '351 2': 'Ok1400', '352 1': 'Ok45'}
+
+        async def send_command(command):
+            self.sent.append(command)
+            return self.replies.get(command, '')
+
+        self.proj._send_command = send_command
+
+    def test_fan_speeds_are_read_from_replies(self):
+        fans = asyncio.run(self.proj.get_fan_speeds())
+        self.assertEqual(fans, {'System Fan 1': 1200, 'System Fan 2': 1300, 'Optical Fan': 1400})
+        self.assertEqual(self.sent, ['351 0', '351 1', '351 2'])
+
+    def test_repeated_reads_are_not_served_from_cache(self):
+        asyncio.run(self.proj.get_fan_speeds())
+        self.replies['351 2'] = 'Ok1500'
+        fans = asyncio.run(self.proj.get_fan_speeds())
+        self.assertEqual(fans['Optical Fan'], 1500)
+
+    def test_status_bundle_fans(self):
+        status = asyncio.run(self.proj.get_status_bundle(['fans', 'temperature']))
+        self.assertEqual(status['fans'], {'System Fan 1': 1200, 'System Fan 2': 1300, 'Optical Fan': 1400})
+        self.assertEqual(status['temperature'], 45)
+        self.assertEqual(sorted(self.sent), ['351 0', '351 1', '351 2', '352 1'])
+
+    def test_all_status_fans(self):
+        status = asyncio.run(self.proj.get_all_status())
+        self.assertEqual(status['fans'], {'System Fan 1': 1200, 'System Fan 2': 1300, 'Optical Fan': 1400})
+        self.assertEqual(self.sent.count('351 0'), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()